@@ -3,8 +3,10 @@
 import os
 import sys
 from logging.config import fileConfig
+from typing import Any
 
 from alembic import context
+from alembic.runtime.migration import MigrationContext
 from sqlalchemy import engine_from_config, pool
 
 # Add the backend src directory to the Python path
@@ -13,7 +15,7 @@ sys.path.insert(
 )
 
 # Import the Base and all models
-from models import APILog, Base, Document, Mindmap, Summary, User
+from models import APILog, Base, Document, DocumentText, Mindmap, Summary, User
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -33,6 +35,42 @@ target_metadata = Base.metadata
 # my_important_option = config.get_main_option("my_important_option")
 # ... etc.
 
+# Fail fast instead of queueing behind (and blocking) live traffic; long
+# CONCURRENTLY index builds still get a generous statement budget.
+# CREATE/DROP INDEX CONCURRENTLY waits for older transactions through lock
+# waits, so migrations lift lock_timeout (SET lock_timeout = 0) inside their
+# autocommit blocks; restore_migration_timeouts puts it back after each step.
+LOCK_TIMEOUT = "2s"
+STATEMENT_TIMEOUT = "30min"
+TIMEOUT_STATEMENTS = (
+    f"SET lock_timeout = '{LOCK_TIMEOUT}'",
+    f"SET statement_timeout = '{STATEMENT_TIMEOUT}'",
+)
+
+
+def set_migration_timeouts() -> None:
+    """Apply session-level lock and statement timeouts for the migration run.
+
+    Plain SET (not SET LOCAL) so the values survive the commits issued by
+    autocommit blocks around CREATE INDEX CONCURRENTLY.
+    """
+    for statement in TIMEOUT_STATEMENTS:
+        context.execute(statement)
+
+
+def restore_migration_timeouts(ctx: MigrationContext, **kwargs: Any) -> None:
+    """Re-apply the timeouts after each migration step (on_version_apply hook).
+
+    A step that lifted lock_timeout for a concurrent index build must not
+    leave later steps without it.
+
+    Args:
+        ctx: Migration context of the run
+        **kwargs: Step details passed by Alembic (unused)
+    """
+    for statement in TIMEOUT_STATEMENTS:
+        ctx.execute(statement)
+
 
 def get_url():
     """Get database URL from environment variable or config."""
@@ -64,9 +102,11 @@ def run_migrations_offline() -> None:
         dialect_opts={"paramstyle": "named"},
         compare_type=True,
         compare_server_default=True,
+        on_version_apply=restore_migration_timeouts,
     )
 
     with context.begin_transaction():
+        set_migration_timeouts()
         context.run_migrations()
 
 
@@ -93,9 +133,11 @@ def run_migrations_online() -> None:
             target_metadata=target_metadata,
             compare_type=True,
             compare_server_default=True,
+            on_version_apply=restore_migration_timeouts,
         )
 
         with context.begin_transaction():
+            set_migration_timeouts()
             context.run_migrations()
 
 
@@ -0,0 +1,58 @@
+"""Add jsonb_path_ops GIN index on documents.metadata
+
+Revision ID: 002_documents_metadata_gin
+Revises: 001_initial_schema
+Create Date: 2025-11-20 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "002_documents_metadata_gin"
+down_revision: Union[str, None] = "001_initial_schema"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index PDF metadata for containment (@>) lookups.
+
+    jsonb_path_ops only supports @>, @? and @@, but yields a smaller and more
+    selective index than the default jsonb_ops. Queries must use containment
+    (e.g. ``Document.pdf_metadata.contains({"author": "X"})``) to hit it.
+    """
+    with op.get_context().autocommit_block():
+        # CONCURRENTLY waits out older transactions; see LOCK_TIMEOUT in env.py
+        op.execute("SET lock_timeout = 0")
+        # A failed earlier run can leave an INVALID index behind
+        op.drop_index(
+            "ix_documents_metadata_gin",
+            table_name="documents",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.create_index(
+            "ix_documents_metadata_gin",
+            "documents",
+            ["metadata"],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={"metadata": "jsonb_path_ops"},
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Drop metadata GIN index."""
+    with op.get_context().autocommit_block():
+        # CONCURRENTLY waits out older transactions; see LOCK_TIMEOUT in env.py
+        op.execute("SET lock_timeout = 0")
+        op.drop_index(
+            "ix_documents_metadata_gin",
+            table_name="documents",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,67 @@
+"""Add generated tsvector column for full-text search on documents
+
+Revision ID: 003_documents_extracted_tsv
+Revises: 002_documents_metadata_gin
+Create Date: 2025-11-20 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "003_documents_extracted_tsv"
+down_revision: Union[str, None] = "002_documents_metadata_gin"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add stored tsvector over extracted_text and index it with GIN.
+
+    Search with ``extracted_tsv @@ plainto_tsquery('english', :q)``; the
+    expression must match the generated column for the index to be used.
+    """
+    op.add_column(
+        "documents",
+        sa.Column(
+            "extracted_tsv",
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "to_tsvector('english', coalesce(extracted_text, ''))",
+                persisted=True,
+            ),
+            nullable=True,
+            comment="Generated tsvector of extracted_text for full-text search",
+        ),
+        # The column is committed before the index build, so a re-run after a
+        # failed build must skip it
+        if_not_exists=True,
+    )
+    with op.get_context().autocommit_block():
+        # CONCURRENTLY waits out older transactions; see LOCK_TIMEOUT in env.py
+        op.execute("SET lock_timeout = 0")
+        # A failed earlier run can leave an INVALID index behind
+        op.drop_index(
+            "ix_documents_extracted_tsv",
+            table_name="documents",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.create_index(
+            "ix_documents_extracted_tsv",
+            "documents",
+            ["extracted_tsv"],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Drop full-text search column and index."""
+    op.drop_index("ix_documents_extracted_tsv", table_name="documents")
+    op.drop_column("documents", "extracted_tsv")
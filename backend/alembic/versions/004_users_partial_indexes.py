@@ -0,0 +1,74 @@
+"""Use partial indexes for the users soft-delete pattern
+
+Revision ID: 004_users_partial_indexes
+Revises: 003_documents_extracted_tsv
+Create Date: 2025-11-20 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "004_users_partial_indexes"
+down_revision: Union[str, None] = "003_documents_extracted_tsv"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Replace global email uniqueness with partial indexes on deleted_at.
+
+    Email stays unique among active users only, so a soft-deleted account no
+    longer blocks re-registration. Deleted rows get their own small index for
+    the purge job.
+    """
+    with op.get_context().autocommit_block():
+        # CONCURRENTLY waits out older transactions; see LOCK_TIMEOUT in env.py
+        op.execute("SET lock_timeout = 0")
+        # A failed earlier run can leave an INVALID index behind
+        op.drop_index(
+            "ix_users_active_email",
+            table_name="users",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_users_deleted_at",
+            table_name="users",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.create_index(
+            "ix_users_active_email",
+            "users",
+            ["email"],
+            unique=True,
+            postgresql_where=sa.text("deleted_at IS NULL"),
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_users_deleted_at",
+            "users",
+            ["deleted_at"],
+            unique=False,
+            postgresql_where=sa.text("deleted_at IS NOT NULL"),
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_users_email",
+            table_name="users",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.drop_constraint("users_email_key", "users", type_="unique")
+
+
+def downgrade() -> None:
+    """Restore global email uniqueness."""
+    op.create_unique_constraint("users_email_key", "users", ["email"])
+    op.create_index("ix_users_email", "users", ["email"], unique=True)
+    op.drop_index("ix_users_deleted_at", table_name="users")
+    op.drop_index("ix_users_active_email", table_name="users")
@@ -0,0 +1,61 @@
+"""Add documents.deleted_at and covering index for document listings
+
+Revision ID: 005_documents_user_list_index
+Revises: 004_users_partial_indexes
+Create Date: 2025-11-20 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "005_documents_user_list_index"
+down_revision: Union[str, None] = "004_users_partial_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add soft delete to documents and a covering index for the dashboard.
+
+    The listing query (live documents of a user, newest first, selecting
+    filename and status) becomes an index-only scan with no sort node.
+    ix_documents_user_created is kept for queries that include deleted rows.
+    """
+    op.add_column(
+        "documents",
+        sa.Column(
+            "deleted_at", sa.TIMESTAMP(), nullable=True, comment="Soft delete flag"
+        ),
+        # The column is committed before the index build, so a re-run after a
+        # failed build must skip it
+        if_not_exists=True,
+    )
+    with op.get_context().autocommit_block():
+        # CONCURRENTLY waits out older transactions; see LOCK_TIMEOUT in env.py
+        op.execute("SET lock_timeout = 0")
+        # A failed earlier run can leave an INVALID index behind
+        op.drop_index(
+            "ix_documents_user_list",
+            table_name="documents",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.create_index(
+            "ix_documents_user_list",
+            "documents",
+            ["user_id", sa.text("created_at DESC")],
+            unique=False,
+            postgresql_include=["filename", "upload_status"],
+            postgresql_where=sa.text("deleted_at IS NULL"),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Drop listing index and documents.deleted_at."""
+    op.drop_index("ix_documents_user_list", table_name="documents")
+    op.drop_column("documents", "deleted_at")
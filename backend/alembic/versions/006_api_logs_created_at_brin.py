@@ -0,0 +1,57 @@
+"""Replace api_logs.created_at B-tree with a BRIN index
+
+Revision ID: 006_api_logs_created_at_brin
+Revises: 005_documents_user_list_index
+Create Date: 2025-11-20 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "006_api_logs_created_at_brin"
+down_revision: Union[str, None] = "005_documents_user_list_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index append-only api_logs timestamps with BRIN.
+
+    created_at follows physical insert order, so per-range min/max summaries
+    serve time-window scans at a tiny fraction of the B-tree size and without
+    a B-tree update on every insert.
+    """
+    with op.get_context().autocommit_block():
+        # CONCURRENTLY waits out older transactions; see LOCK_TIMEOUT in env.py
+        op.execute("SET lock_timeout = 0")
+        # A failed earlier run can leave an INVALID index behind
+        op.drop_index(
+            "ix_api_logs_created_at_brin",
+            table_name="api_logs",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.create_index(
+            "ix_api_logs_created_at_brin",
+            "api_logs",
+            ["created_at"],
+            unique=False,
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_api_logs_created_at",
+            table_name="api_logs",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Restore B-tree index on api_logs.created_at."""
+    op.drop_index("ix_api_logs_created_at_brin", table_name="api_logs")
+    op.create_index("ix_api_logs_created_at", "api_logs", ["created_at"], unique=False)
@@ -0,0 +1,91 @@
+"""Replace full status indexes with partial indexes on non-terminal states
+
+Revision ID: 007_partial_status_indexes
+Revises: 006_api_logs_created_at_brin
+Create Date: 2025-11-20 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "007_partial_status_indexes"
+down_revision: Union[str, None] = "006_api_logs_created_at_brin"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (old full-column index, table, status column, new partial index, predicate)
+PARTIAL_STATUS_INDEXES = [
+    (
+        "ix_documents_upload_status",
+        "documents",
+        "upload_status",
+        "ix_documents_pending",
+        "upload_status IN ('uploading', 'parsing', 'failed')",
+    ),
+    (
+        "ix_summaries_generation_status",
+        "summaries",
+        "generation_status",
+        "ix_summaries_pending",
+        "generation_status IN ('queued', 'generating', 'failed')",
+    ),
+    (
+        "ix_mindmaps_generation_status",
+        "mindmaps",
+        "generation_status",
+        "ix_mindmaps_pending",
+        "generation_status IN ('queued', 'generating', 'failed')",
+    ),
+    (
+        "ix_api_logs_status",
+        "api_logs",
+        "status",
+        "ix_api_logs_failed",
+        "status IN ('rate_limited', 'timeout', 'error')",
+    ),
+]
+
+
+def upgrade() -> None:
+    """Index only rows that have not reached a terminal success state.
+
+    Almost every row ends up 'ready' / 'complete' / 'success', so the partial
+    indexes stay roughly queue-sized while worker polls (ordered by
+    created_at) keep an index path.
+    """
+    with op.get_context().autocommit_block():
+        # CONCURRENTLY waits out older transactions; see LOCK_TIMEOUT in env.py
+        op.execute("SET lock_timeout = 0")
+        for old_index, table, _column, new_index, predicate in PARTIAL_STATUS_INDEXES:
+            # A failed earlier run can leave an INVALID index behind
+            op.drop_index(
+                new_index,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+            op.create_index(
+                new_index,
+                table,
+                ["created_at"],
+                unique=False,
+                postgresql_where=sa.text(predicate),
+                postgresql_concurrently=True,
+            )
+            op.drop_index(
+                old_index,
+                table_name=table,
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+
+
+def downgrade() -> None:
+    """Restore full-column status indexes."""
+    for old_index, table, column, new_index, _predicate in PARTIAL_STATUS_INDEXES:
+        op.create_index(old_index, table, [column], unique=False)
+        op.drop_index(new_index, table_name=table)
@@ -0,0 +1,96 @@
+"""Move extracted text into a 1:1 document_texts table
+
+Revision ID: 008_document_texts
+Revises: 007_partial_status_indexes
+Create Date: 2025-11-20 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "008_document_texts"
+down_revision: Union[str, None] = "007_partial_status_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TSV_EXPRESSION = "to_tsvector('english', coalesce(extracted_text, ''))"
+
+
+def upgrade() -> None:
+    """Split extracted_text (and its tsvector) off the hot documents table."""
+    op.create_table(
+        "document_texts",
+        sa.Column("document_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "extracted_text",
+            sa.Text(),
+            nullable=True,
+            comment="Full document text (for full-text search)",
+        ),
+        sa.Column(
+            "extracted_tsv",
+            postgresql.TSVECTOR(),
+            sa.Computed(TSV_EXPRESSION, persisted=True),
+            nullable=True,
+            comment="Generated tsvector of extracted_text for full-text search",
+        ),
+        sa.ForeignKeyConstraint(["document_id"], ["documents.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("document_id"),
+    )
+    op.execute(
+        "INSERT INTO document_texts (document_id, extracted_text) "
+        "SELECT id, extracted_text FROM documents WHERE extracted_text IS NOT NULL"
+    )
+    op.create_index(
+        "ix_document_texts_extracted_tsv",
+        "document_texts",
+        ["extracted_tsv"],
+        unique=False,
+        postgresql_using="gin",
+    )
+
+    op.drop_index("ix_documents_extracted_tsv", table_name="documents")
+    op.drop_column("documents", "extracted_tsv")
+    op.drop_column("documents", "extracted_text")
+
+
+def downgrade() -> None:
+    """Move extracted text back onto documents."""
+    op.add_column(
+        "documents",
+        sa.Column(
+            "extracted_text",
+            sa.Text(),
+            nullable=True,
+            comment="Full document text (for full-text search)",
+        ),
+    )
+    op.execute(
+        "UPDATE documents SET extracted_text = t.extracted_text "
+        "FROM document_texts t WHERE t.document_id = documents.id"
+    )
+    op.add_column(
+        "documents",
+        sa.Column(
+            "extracted_tsv",
+            postgresql.TSVECTOR(),
+            sa.Computed(TSV_EXPRESSION, persisted=True),
+            nullable=True,
+            comment="Generated tsvector of extracted_text for full-text search",
+        ),
+    )
+    op.create_index(
+        "ix_documents_extracted_tsv",
+        "documents",
+        ["extracted_tsv"],
+        unique=False,
+        postgresql_using="gin",
+    )
+
+    op.drop_index("ix_document_texts_extracted_tsv", table_name="document_texts")
+    op.drop_table("document_texts")
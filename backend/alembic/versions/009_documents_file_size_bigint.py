@@ -0,0 +1,127 @@
+"""Widen documents.file_size_bytes to BIGINT
+
+Revision ID: 009_documents_file_size_bigint
+Revises: 008_document_texts
+Create Date: 2025-11-20 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "009_documents_file_size_bigint"
+down_revision: Union[str, None] = "008_document_texts"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Rows copied per backfill transaction
+BACKFILL_BATCH_SIZE = 10_000
+
+# Copies writes made during the backfill into the new column
+CREATE_SYNC_FUNCTION = """
+CREATE OR REPLACE FUNCTION documents_file_size_bytes_sync()
+RETURNS trigger
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    NEW.file_size_bytes_new := NEW.file_size_bytes;
+    RETURN NEW;
+END;
+$$
+"""
+
+CREATE_SYNC_TRIGGER = """
+CREATE TRIGGER documents_file_size_bytes_sync
+BEFORE INSERT OR UPDATE OF file_size_bytes ON documents
+FOR EACH ROW EXECUTE FUNCTION documents_file_size_bytes_sync()
+"""
+
+# One short transaction per id range (COMMIT in DO needs autocommit)
+BACKFILL = f"""
+DO $$
+DECLARE
+    batch_start bigint := 0;
+    max_id bigint := (SELECT coalesce(max(id), 0) FROM documents);
+BEGIN
+    WHILE batch_start < max_id LOOP
+        UPDATE documents SET file_size_bytes_new = file_size_bytes
+        WHERE id > batch_start
+            AND id <= batch_start + {BACKFILL_BATCH_SIZE}
+            AND file_size_bytes_new IS NULL;
+        batch_start := batch_start + {BACKFILL_BATCH_SIZE};
+        COMMIT;
+    END LOOP;
+END;
+$$
+"""
+
+# Validated ahead of the swap so it needs no scan under ACCESS EXCLUSIVE
+NEW_COLUMN_CHECKS = (
+    ("ck_document_file_size_not_null", "file_size_bytes_new IS NOT NULL"),
+    ("ck_document_max_size_new", "file_size_bytes_new <= 104857600"),  # 100 MB
+)
+
+
+def upgrade() -> None:
+    """Widen file_size_bytes to BIGINT without rewriting documents.
+
+    INTEGER caps out at 2 GB. ALTER COLUMN TYPE would rewrite the table and
+    its indexes under ACCESS EXCLUSIVE, and 001 has already shipped, so the
+    column is swapped instead: add a BIGINT column, keep it in sync with a
+    trigger, backfill it in batches, validate its constraints, then drop the
+    old column and rename the new one in a short metadata-only transaction.
+    The column moves to the end of the table. The 100 MB upload limit stays
+    enforced by ck_document_max_size.
+    """
+    op.add_column(
+        "documents",
+        sa.Column("file_size_bytes_new", sa.BigInteger(), nullable=True),
+        if_not_exists=True,
+    )
+    op.execute(CREATE_SYNC_FUNCTION)
+    op.execute("DROP TRIGGER IF EXISTS documents_file_size_bytes_sync ON documents")
+    op.execute(CREATE_SYNC_TRIGGER)
+
+    # Commits the trigger first, so no write during the backfill is missed
+    with op.get_context().autocommit_block():
+        op.execute(BACKFILL)
+        for name, condition in NEW_COLUMN_CHECKS:
+            op.execute(f"ALTER TABLE documents DROP CONSTRAINT IF EXISTS {name}")
+            op.execute(
+                f"ALTER TABLE documents ADD CONSTRAINT {name} "
+                f"CHECK ({condition}) NOT VALID"
+            )
+            op.execute(f"ALTER TABLE documents VALIDATE CONSTRAINT {name}")
+
+    op.execute("DROP TRIGGER documents_file_size_bytes_sync ON documents")
+    op.execute("DROP FUNCTION documents_file_size_bytes_sync()")
+    # Skips the scan: the validated check already proves it
+    op.alter_column("documents", "file_size_bytes_new", nullable=False)
+    op.drop_constraint("ck_document_file_size_not_null", "documents", type_="check")
+    # Also drops ck_document_max_size, which the _new check replaces
+    op.drop_column("documents", "file_size_bytes")
+    op.alter_column(
+        "documents",
+        "file_size_bytes_new",
+        new_column_name="file_size_bytes",
+        comment="Size for quota enforcement",
+    )
+    op.execute(
+        "ALTER TABLE documents "
+        "RENAME CONSTRAINT ck_document_max_size_new TO ck_document_max_size"
+    )
+
+
+def downgrade() -> None:
+    """Narrow file_size_bytes back to INTEGER (rewrites the table)."""
+    op.alter_column(
+        "documents",
+        "file_size_bytes",
+        existing_type=sa.BigInteger(),
+        type_=sa.Integer(),
+        existing_nullable=False,
+        existing_comment="Size for quota enforcement",
+    )
@@ -0,0 +1,251 @@
+"""Partition api_logs by month on created_at
+
+Revision ID: 010_partition_api_logs
+Revises: 009_documents_file_size_bigint
+Create Date: 2025-11-20 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "010_partition_api_logs"
+down_revision: Union[str, None] = "009_documents_file_size_bigint"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Monthly partitions created ahead of time; the running application keeps
+# calling create_api_logs_partition() for upcoming months after that (see
+# maintain_api_log_partitions in src/utils/api_log_writer.py)
+MONTHS_AHEAD = 12
+
+API_LOG_COLUMNS = (
+    "id, document_id, operation, tokens_input, tokens_output, cost_usd, "
+    "latency_ms, status, error_code, created_at"
+)
+
+CREATE_PARTITION_FUNCTION = """
+CREATE OR REPLACE FUNCTION create_api_logs_partition(month_start date)
+RETURNS void
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    start_date date := date_trunc('month', month_start)::date;
+    end_date date := (start_date + interval '1 month')::date;
+    partition_name text := 'api_logs_' || to_char(start_date, 'YYYY_MM');
+BEGIN
+    -- Serialize callers (every app process runs this at startup)
+    PERFORM pg_advisory_xact_lock(hashtext('create_api_logs_partition'));
+    IF to_regclass(partition_name) IS NOT NULL THEN
+        RETURN;
+    END IF;
+
+    -- A partition cannot be attached while api_logs_default holds rows in its
+    -- range, so build it standalone and move those rows across first
+    EXECUTE format(
+        'CREATE TABLE %I (LIKE api_logs INCLUDING DEFAULTS INCLUDING CONSTRAINTS)',
+        partition_name
+    );
+    IF to_regclass('api_logs_default') IS NOT NULL THEN
+        EXECUTE format(
+            'WITH moved AS (DELETE FROM api_logs_default '
+            'WHERE created_at >= %L AND created_at < %L RETURNING *) '
+            'INSERT INTO %I SELECT * FROM moved',
+            start_date,
+            end_date,
+            partition_name
+        );
+    END IF;
+    -- Attaching adds the parent's indexes, primary key and foreign key
+    EXECUTE format(
+        'ALTER TABLE api_logs ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+        partition_name,
+        start_date,
+        end_date
+    );
+END;
+$$
+"""
+
+# Cover every month that already has rows, up to MONTHS_AHEAD from now
+CREATE_INITIAL_PARTITIONS = f"""
+DO $$
+DECLARE
+    partition_start date := date_trunc(
+        'month',
+        coalesce((SELECT min(created_at) FROM api_logs_unpartitioned), now())
+    )::date;
+BEGIN
+    WHILE partition_start < date_trunc('month', now())
+        + interval '{MONTHS_AHEAD} months' LOOP
+        PERFORM create_api_logs_partition(partition_start);
+        partition_start := (partition_start + interval '1 month')::date;
+    END LOOP;
+END;
+$$
+"""
+
+
+def api_log_table_columns() -> list:
+    """Columns and constraints shared by the plain and partitioned tables."""
+    return [
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column(
+            "document_id",
+            sa.Integer(),
+            nullable=True,
+            comment="Document being processed (NULL for metadata calls)",
+        ),
+        sa.Column(
+            "operation",
+            sa.String(length=50),
+            nullable=False,
+            comment="'summarize' or 'mindmap'",
+        ),
+        sa.Column("tokens_input", sa.Integer(), nullable=False, comment="Input tokens"),
+        sa.Column(
+            "tokens_output", sa.Integer(), nullable=False, comment="Output tokens"
+        ),
+        sa.Column(
+            "cost_usd",
+            sa.DECIMAL(precision=10, scale=6),
+            nullable=False,
+            comment="Calculated cost (tokens * rate)",
+        ),
+        sa.Column("latency_ms", sa.Integer(), nullable=False, comment="API latency"),
+        sa.Column(
+            "status",
+            sa.String(length=20),
+            nullable=False,
+            comment="'success', 'rate_limited', 'timeout', 'error'",
+        ),
+        sa.Column(
+            "error_code",
+            sa.String(length=50),
+            nullable=True,
+            comment="'RATE_LIMIT', 'TIMEOUT', 'AUTH_ERROR', etc.",
+        ),
+        sa.Column(
+            "created_at",
+            sa.TIMESTAMP(),
+            server_default=sa.text("now()"),
+            nullable=False,
+            comment="Request timestamp",
+        ),
+        sa.CheckConstraint(
+            "operation IN ('summarize', 'mindmap')", name="ck_apilog_operation"
+        ),
+        sa.CheckConstraint(
+            "status IN ('success', 'rate_limited', 'timeout', 'error')",
+            name="ck_apilog_status",
+        ),
+        sa.CheckConstraint("cost_usd >= 0", name="ck_apilog_cost_positive"),
+        sa.CheckConstraint("latency_ms >= 0", name="ck_apilog_latency_positive"),
+        sa.ForeignKeyConstraint(["document_id"], ["documents.id"], ondelete="SET NULL"),
+    ]
+
+
+def create_api_log_indexes() -> None:
+    """Create api_logs indexes (on a partitioned table, one per partition)."""
+    op.create_index(
+        "ix_api_logs_document_id", "api_logs", ["document_id"], unique=False
+    )
+    op.create_index("ix_api_logs_operation", "api_logs", ["operation"], unique=False)
+    op.create_index(
+        "ix_api_logs_created_at_brin",
+        "api_logs",
+        ["created_at"],
+        unique=False,
+        postgresql_using="brin",
+        postgresql_with={"pages_per_range": 32},
+    )
+    op.create_index(
+        "ix_api_logs_failed",
+        "api_logs",
+        ["created_at"],
+        unique=False,
+        postgresql_where=sa.text("status IN ('rate_limited', 'timeout', 'error')"),
+    )
+
+
+def drop_api_log_indexes(table_name: str) -> None:
+    """Drop api_logs indexes so their names can be reused."""
+    for index_name in (
+        "ix_api_logs_failed",
+        "ix_api_logs_created_at_brin",
+        "ix_api_logs_operation",
+        "ix_api_logs_document_id",
+    ):
+        op.drop_index(index_name, table_name=table_name)
+
+
+def upgrade() -> None:
+    """Rebuild api_logs as a RANGE-partitioned table (one partition per month).
+
+    Time-window queries prune to the matching partitions and retention becomes
+    DETACH/DROP PARTITION instead of DELETE + VACUUM. The primary key must
+    include the partition key, so it becomes (id, created_at). Rows outside
+    every monthly partition land in api_logs_default; create_api_logs_partition
+    moves them into the month's partition when that partition is created.
+    """
+    # Move the existing table (and the names it owns) out of the way
+    op.rename_table("api_logs", "api_logs_unpartitioned")
+    op.execute("ALTER SEQUENCE api_logs_id_seq RENAME TO api_logs_unpartitioned_id_seq")
+    op.execute(
+        "ALTER TABLE api_logs_unpartitioned "
+        "RENAME CONSTRAINT api_logs_pkey TO api_logs_unpartitioned_pkey"
+    )
+    drop_api_log_indexes("api_logs_unpartitioned")
+
+    op.create_table(
+        "api_logs",
+        *api_log_table_columns(),
+        sa.PrimaryKeyConstraint("id", "created_at"),
+        postgresql_partition_by="RANGE (created_at)",
+    )
+    op.execute(CREATE_PARTITION_FUNCTION)
+    op.execute(CREATE_INITIAL_PARTITIONS)
+    op.execute("CREATE TABLE api_logs_default PARTITION OF api_logs DEFAULT")
+    create_api_log_indexes()
+
+    op.execute(
+        f"INSERT INTO api_logs ({API_LOG_COLUMNS}) "
+        f"SELECT {API_LOG_COLUMNS} FROM api_logs_unpartitioned"
+    )
+    op.execute(
+        "SELECT setval('api_logs_id_seq', "
+        "coalesce((SELECT max(id) FROM api_logs), 0) + 1, false)"
+    )
+    op.drop_table("api_logs_unpartitioned")
+
+
+def downgrade() -> None:
+    """Rebuild api_logs as a plain table."""
+    op.rename_table("api_logs", "api_logs_partitioned")
+    op.execute("ALTER SEQUENCE api_logs_id_seq RENAME TO api_logs_partitioned_id_seq")
+    op.execute(
+        "ALTER TABLE api_logs_partitioned "
+        "RENAME CONSTRAINT api_logs_pkey TO api_logs_partitioned_pkey"
+    )
+    drop_api_log_indexes("api_logs_partitioned")
+
+    op.create_table(
+        "api_logs",
+        *api_log_table_columns(),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    create_api_log_indexes()
+
+    op.execute(
+        f"INSERT INTO api_logs ({API_LOG_COLUMNS}) "
+        f"SELECT {API_LOG_COLUMNS} FROM api_logs_partitioned"
+    )
+    op.execute(
+        "SELECT setval('api_logs_id_seq', "
+        "coalesce((SELECT max(id) FROM api_logs), 0) + 1, false)"
+    )
+    op.drop_table("api_logs_partitioned")
+    op.execute("DROP FUNCTION IF EXISTS create_api_logs_partition(date)")
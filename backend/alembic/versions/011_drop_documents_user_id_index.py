@@ -0,0 +1,56 @@
+"""Drop redundant ix_documents_user_id
+
+Revision ID: 011_drop_documents_user_id_index
+Revises: 010_partition_api_logs
+Create Date: 2025-11-20 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "011_drop_documents_user_id_index"
+down_revision: Union[str, None] = "010_partition_api_logs"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Drop ix_documents_user_id.
+
+    user_id is the leading column of ix_documents_user_created, which serves
+    user_id lookups (including the ON DELETE CASCADE from users) equally well;
+    the single-column index only added write cost to every upload.
+    """
+    with op.get_context().autocommit_block():
+        # CONCURRENTLY waits out older transactions; see LOCK_TIMEOUT in env.py
+        op.execute("SET lock_timeout = 0")
+        op.drop_index(
+            "ix_documents_user_id",
+            table_name="documents",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Restore ix_documents_user_id."""
+    with op.get_context().autocommit_block():
+        # CONCURRENTLY waits out older transactions; see LOCK_TIMEOUT in env.py
+        op.execute("SET lock_timeout = 0")
+        # A failed earlier run can leave an INVALID index behind
+        op.drop_index(
+            "ix_documents_user_id",
+            table_name="documents",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.create_index(
+            "ix_documents_user_id",
+            "documents",
+            ["user_id"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,127 @@
+"""Replace native status enums with CHECK-constrained VARCHAR columns
+
+Revision ID: 012_status_check_constraints
+Revises: 011_drop_documents_user_id_index
+Create Date: 2025-11-20 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "012_status_check_constraints"
+down_revision: Union[str, None] = "011_drop_documents_user_id_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+GENERATION_STATES = "('queued', 'generating', 'complete', 'failed')"
+
+# (table, column, enum type, allowed values, default, check name,
+#  pending index, pending predicate)
+STATUS_COLUMNS = [
+    (
+        "documents",
+        "upload_status",
+        "upload_status_enum",
+        "('uploading', 'parsing', 'ready', 'failed')",
+        "uploading",
+        "ck_document_upload_status",
+        "ix_documents_pending",
+        "upload_status IN ('uploading', 'parsing', 'failed')",
+    ),
+    (
+        "summaries",
+        "generation_status",
+        "generation_status_enum",
+        GENERATION_STATES,
+        "queued",
+        "ck_summary_generation_status",
+        "ix_summaries_pending",
+        "generation_status IN ('queued', 'generating', 'failed')",
+    ),
+    (
+        "mindmaps",
+        "generation_status",
+        "mindmap_status_enum",
+        GENERATION_STATES,
+        "queued",
+        "ck_mindmap_generation_status",
+        "ix_mindmaps_pending",
+        "generation_status IN ('queued', 'generating', 'failed')",
+    ),
+]
+
+
+def upgrade() -> None:
+    """Convert status columns to VARCHAR(16) + CHECK and drop the enum types.
+
+    Adding a state later is a constraint swap (ADD ... NOT VALID, then
+    VALIDATE) instead of ALTER TYPE ... ADD VALUE, which cannot run inside a
+    transaction. The partial pending indexes reference the status column in
+    their predicates, so they are rebuilt around the type change.
+    """
+    for (
+        table,
+        column,
+        enum_name,
+        values,
+        default,
+        check_name,
+        pending_index,
+        predicate,
+    ) in STATUS_COLUMNS:
+        op.drop_index(pending_index, table_name=table)
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} DROP DEFAULT")
+        op.alter_column(
+            table,
+            column,
+            type_=sa.String(length=16),
+            existing_nullable=False,
+            postgresql_using=f"{column}::text",
+        )
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} SET DEFAULT '{default}'")
+        op.create_check_constraint(check_name, table, f"{column} IN {values}")
+        op.create_index(
+            pending_index,
+            table,
+            ["created_at"],
+            unique=False,
+            postgresql_where=sa.text(predicate),
+        )
+        op.execute(f"DROP TYPE IF EXISTS {enum_name}")
+
+
+def downgrade() -> None:
+    """Restore native enum status columns."""
+    for (
+        table,
+        column,
+        enum_name,
+        values,
+        default,
+        check_name,
+        pending_index,
+        predicate,
+    ) in STATUS_COLUMNS:
+        op.execute(f"CREATE TYPE {enum_name} AS ENUM {values}")
+        op.drop_index(pending_index, table_name=table)
+        op.drop_constraint(check_name, table, type_="check")
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} DROP DEFAULT")
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} "
+            f"TYPE {enum_name} USING {column}::{enum_name}"
+        )
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} "
+            f"SET DEFAULT '{default}'::{enum_name}"
+        )
+        op.create_index(
+            pending_index,
+            table,
+            ["created_at"],
+            unique=False,
+            postgresql_where=sa.text(predicate),
+        )
@@ -0,0 +1,44 @@
+"""Compute documents.expires_at default in the database
+
+Revision ID: 013_documents_expires_at_default
+Revises: 012_status_check_constraints
+Create Date: 2025-11-20 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "013_documents_expires_at_default"
+down_revision: Union[str, None] = "012_status_check_constraints"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Default expires_at to 30 days after insert time.
+
+    Replaces the per-row Python default with a server default, evaluated on
+    the same clock as created_at (now()). Existing rows are unaffected.
+    """
+    op.alter_column(
+        "documents",
+        "expires_at",
+        server_default=sa.text("(now() + interval '30 days')"),
+        existing_type=sa.TIMESTAMP(),
+        existing_nullable=False,
+    )
+
+
+def downgrade() -> None:
+    """Remove the expires_at server default."""
+    op.alter_column(
+        "documents",
+        "expires_at",
+        server_default=None,
+        existing_type=sa.TIMESTAMP(),
+        existing_nullable=False,
+    )
@@ -0,0 +1,56 @@
+"""Store documents.file_hash as a raw 32-byte digest
+
+Revision ID: 014_documents_file_hash_bytea
+Revises: 013_documents_expires_at_default
+Create Date: 2025-11-20 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "014_documents_file_hash_bytea"
+down_revision: Union[str, None] = "013_documents_expires_at_default"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Convert file_hash from 64-char hex text to 32-byte bytea.
+
+    Halves the column and the uq_user_document_hash index entries, and
+    dedup lookups compare raw bytes. Existing hex values are decoded in
+    place; the unique constraint's index is rebuilt by the type change.
+    bytea has no length limit, so a check constraint enforces 32 bytes.
+    """
+    op.alter_column(
+        "documents",
+        "file_hash",
+        type_=sa.LargeBinary(),
+        existing_type=sa.String(length=64),
+        existing_nullable=False,
+        comment="Raw SHA-256 digest (32 bytes) for deduplication",
+        existing_comment="SHA-256 hash for deduplication",
+        postgresql_using="decode(file_hash, 'hex')",
+    )
+    op.create_check_constraint(
+        "ck_document_file_hash_length", "documents", "octet_length(file_hash) = 32"
+    )
+
+
+def downgrade() -> None:
+    """Convert file_hash back to lowercase hex text."""
+    op.drop_constraint("ck_document_file_hash_length", "documents", type_="check")
+    op.alter_column(
+        "documents",
+        "file_hash",
+        type_=sa.String(length=64),
+        existing_type=sa.LargeBinary(),
+        existing_nullable=False,
+        comment="SHA-256 hash for deduplication",
+        existing_comment="Raw SHA-256 digest (32 bytes) for deduplication",
+        postgresql_using="encode(file_hash, 'hex')",
+    )
@@ -0,0 +1,40 @@
+"""Compress document_texts TOAST values with lz4
+
+Revision ID: 015_document_texts_lz4_compression
+Revises: 014_documents_file_hash_bytea
+Create Date: 2025-11-20 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "015_document_texts_lz4_compression"
+down_revision: Union[str, None] = "014_documents_file_hash_bytea"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COMPRESSED_COLUMNS = ("extracted_text", "extracted_tsv")
+
+
+def upgrade() -> None:
+    """Use lz4 instead of pglz for the large text columns (PostgreSQL 14+).
+
+    lz4 decompresses several times faster than pglz at a similar ratio, which
+    is what every read of the full text pays. Only newly written values use
+    the new method; existing rows are recompressed when next rewritten.
+    """
+    for column in COMPRESSED_COLUMNS:
+        op.execute(
+            f"ALTER TABLE document_texts ALTER COLUMN {column} SET COMPRESSION lz4"
+        )
+
+
+def downgrade() -> None:
+    """Restore the default TOAST compression method."""
+    for column in COMPRESSED_COLUMNS:
+        op.execute(
+            f"ALTER TABLE document_texts ALTER COLUMN {column} SET COMPRESSION default"
+        )
@@ -0,0 +1,65 @@
+"""Index pending summaries by (generation_status, created_at)
+
+Revision ID: 016_summaries_status_created_index
+Revises: 015_document_texts_lz4_compression
+Create Date: 2025-11-20 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "016_summaries_status_created_index"
+down_revision: Union[str, None] = "015_document_texts_lz4_compression"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PENDING_PREDICATE = "generation_status IN ('queued', 'generating', 'failed')"
+
+
+def upgrade() -> None:
+    """Lead the pending-summaries index with generation_status.
+
+    The worker dequeue (one status, oldest first, LIMIT n) descends straight
+    to the first matching entry and stops after n rows, instead of walking
+    created_at order and filtering out the other pending states.
+    """
+    with op.get_context().autocommit_block():
+        # CONCURRENTLY waits out older transactions; see LOCK_TIMEOUT in env.py
+        op.execute("SET lock_timeout = 0")
+        # A failed earlier run can leave an INVALID index behind
+        op.drop_index(
+            "ix_summaries_status_created",
+            table_name="summaries",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.create_index(
+            "ix_summaries_status_created",
+            "summaries",
+            ["generation_status", "created_at"],
+            unique=False,
+            postgresql_where=sa.text(PENDING_PREDICATE),
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_summaries_pending",
+            table_name="summaries",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    """Restore the created_at-only pending index."""
+    op.create_index(
+        "ix_summaries_pending",
+        "summaries",
+        ["created_at"],
+        unique=False,
+        postgresql_where=sa.text(PENDING_PREDICATE),
+    )
+    op.drop_index("ix_summaries_status_created", table_name="summaries")
@@ -0,0 +1,41 @@
+"""Constrain summaries API metrics to non-negative values
+
+Revision ID: 017_summaries_metrics_check
+Revises: 016_summaries_status_created_index
+Create Date: 2025-11-20 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "017_summaries_metrics_check"
+down_revision: Union[str, None] = "016_summaries_status_created_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add a CHECK on tokens_input, tokens_output and latency_ms.
+
+    Added NOT VALID and validated in a separate transaction, so existing
+    rows are checked under a SHARE UPDATE EXCLUSIVE lock instead of
+    blocking writes for the whole scan.
+    """
+    with op.get_context().autocommit_block():
+        op.execute(
+            "ALTER TABLE summaries ADD CONSTRAINT ck_summary_metrics_non_negative "
+            "CHECK (tokens_input >= 0 AND tokens_output >= 0 AND latency_ms >= 0) "
+            "NOT VALID"
+        )
+        op.execute(
+            "ALTER TABLE summaries "
+            "VALIDATE CONSTRAINT ck_summary_metrics_non_negative"
+        )
+
+
+def downgrade() -> None:
+    """Drop the metrics CHECK constraint."""
+    op.drop_constraint("ck_summary_metrics_non_negative", "summaries", type_="check")
@@ -0,0 +1,50 @@
+"""Cap summaries.error_message at 2000 characters
+
+Revision ID: 018_summaries_error_message_varchar
+Revises: 017_summaries_metrics_check
+Create Date: 2025-11-20 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "018_summaries_error_message_varchar"
+down_revision: Union[str, None] = "017_summaries_metrics_check"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Convert error_message to VARCHAR(2000), truncating longer values.
+
+    Failure messages carrying full stack traces could reach tens of KB; the
+    model now truncates on assignment, so stored values normally stay under
+    the ~2 kB TOAST threshold and remain inline in the row.
+    """
+    op.alter_column(
+        "summaries",
+        "error_message",
+        type_=sa.String(length=2000),
+        existing_type=sa.Text(),
+        existing_nullable=True,
+        comment="Error detail if generation fails (truncated)",
+        existing_comment="Error detail if generation fails",
+        postgresql_using="left(error_message, 2000)",
+    )
+
+
+def downgrade() -> None:
+    """Restore unbounded TEXT (truncated values are not recovered)."""
+    op.alter_column(
+        "summaries",
+        "error_message",
+        type_=sa.Text(),
+        existing_type=sa.String(length=2000),
+        existing_nullable=True,
+        comment="Error detail if generation fails",
+        existing_comment="Error detail if generation fails (truncated)",
+    )
@@ -12,13 +12,16 @@ Used by:
 - Deployment pipelines for readiness checks
 """
 
+import asyncio
+import time
 from datetime import datetime, timezone
-from typing import Literal
+from typing import Callable, Literal, Optional
 
 from fastapi import APIRouter, status
 from pydantic import BaseModel, Field
 from sqlalchemy import text
 
+from src.config import get_settings
 from src.models import get_engine
 from src.utils.logger import get_logger
 
@@ -27,6 +30,24 @@ logger = get_logger(__name__)
 # Create router for health endpoints
 router = APIRouter(prefix="/health", tags=["Health"])
 
+# Upper bound on each dependency probe; a hung dependency reports "error"
+CHECK_TIMEOUT_SECONDS = 2.0
+
+# Skip the database round trip if a probe succeeded within this window
+DB_CHECK_CACHE_SECONDS = 2.0
+
+# time.monotonic() of the last successful database probe
+_db_last_ok: Optional[float] = None
+
+# Whether a Gemini API key is configured, resolved on the first check
+_gemini_configured: Optional[bool] = None
+
+# Serve a healthy response from memory for this long (degraded is never cached)
+HEALTH_CACHE_TTL_SECONDS = 1.0
+
+# (time.monotonic() when built, response body) of the last healthy response
+_cached_response: Optional[tuple[float, dict[str, str]]] = None
+
 
 # ============================================================================
 # RESPONSE MODELS
@@ -70,7 +91,11 @@ def check_database() -> Literal["ok", "error"]:
     """Check database connectivity.
 
     Attempts a simple SELECT 1 query to verify the database is reachable
-    and accepting queries. Uses connection pooling with pre-ping enabled.
+    and accepting queries on a pooled connection. Pre-ping is off by default
+    (DB_POOL_PRE_PING), so a stale pooled connection can fail this check
+    once before the pool replaces it. A success is reused for
+    DB_CHECK_CACHE_SECONDS so frequent load balancer probes do not each cost
+    a database round trip; failures are never cached.
 
     Returns:
         "ok" if database is accessible, "error" otherwise
@@ -79,6 +104,12 @@ def check_database() -> Literal["ok", "error"]:
         >>> status = check_database()
         >>> assert status in ("ok", "error")
     """
+    global _db_last_ok
+
+    now = time.monotonic()
+    if _db_last_ok is not None and now - _db_last_ok < DB_CHECK_CACHE_SECONDS:
+        return "ok"
+
     try:
         engine = get_engine()
         with engine.connect() as conn:
@@ -86,6 +117,7 @@ def check_database() -> Literal["ok", "error"]:
             result = conn.execute(text("SELECT 1"))
             result.fetchone()
 
+        _db_last_ok = now
         logger.debug("Database health check passed")
         return "ok"
 
@@ -112,20 +144,22 @@ def check_gemini_api() -> Literal["ok", "error", "rate_limited"]:
 
     Note:
         This is a minimal check. Full implementation will be added in T064
-        when the Gemini service is implemented.
+        when the Gemini service is implemented. Settings are fixed for the
+        process lifetime, so the key check is resolved once and reused.
     """
+    global _gemini_configured
+
     try:
         # TODO (T064): Replace with actual Gemini API health check
         # For now, just verify the API key is configured
-        from src.config import get_settings
+        if _gemini_configured is None:
+            _gemini_configured = bool(get_settings().gemini_api_key)
 
-        settings = get_settings()
-        if settings.gemini_api_key and len(settings.gemini_api_key) > 0:
-            logger.debug("Gemini API health check passed (placeholder)")
+        if _gemini_configured:
             return "ok"
-        else:
-            logger.warning("Gemini API key not configured")
-            return "error"
+
+        logger.warning("Gemini API key not configured")
+        return "error"
 
     except Exception as e:
         logger.error(
@@ -136,6 +170,34 @@ def check_gemini_api() -> Literal["ok", "error", "rate_limited"]:
         return "error"
 
 
+async def run_check(
+    name: str, check: Callable[[], str], timeout: float = CHECK_TIMEOUT_SECONDS
+) -> str:
+    """Run a blocking health check in a worker thread with a timeout.
+
+    Keeps the event loop free while the probe waits on I/O and lets several
+    probes run concurrently. A probe that exceeds the timeout is reported as
+    "error" (its thread is left to finish in the background).
+
+    Args:
+        name: Dependency name used in logs
+        check: Synchronous check function returning a status string
+        timeout: Maximum seconds to wait for the check
+
+    Returns:
+        Status string returned by the check, or "error" on timeout
+    """
+    try:
+        return await asyncio.wait_for(asyncio.to_thread(check), timeout=timeout)
+    except asyncio.TimeoutError:
+        logger.error(
+            "Health check timed out",
+            dependency=name,
+            timeout_seconds=timeout,
+        )
+        return "error"
+
+
 # ============================================================================
 # ENDPOINTS
 # ============================================================================
@@ -152,7 +214,7 @@ def check_gemini_api() -> Literal["ok", "error", "rate_limited"]:
         "Always returns 200 OK with status details in the response body."
     ),
 )
-async def health_check() -> HealthCheckResponse:
+async def health_check() -> dict[str, str]:
     """Perform comprehensive health check of all service dependencies.
 
     This endpoint checks:
@@ -163,8 +225,12 @@ async def health_check() -> HealthCheckResponse:
     - "ok": All checks passed
     - "degraded": One or more checks failed
 
+    The body is returned as a plain dict; FastAPI validates and serializes it
+    once against ``HealthCheckResponse`` instead of building a model instance
+    only to dump and re-validate it.
+
     Returns:
-        HealthCheckResponse: Health status of all components
+        Health status of all components, shaped like HealthCheckResponse
 
     Example Response:
         {
@@ -174,11 +240,20 @@ async def health_check() -> HealthCheckResponse:
             "timestamp": "2025-01-14T12:34:56.789Z"
         }
     """
+    global _cached_response
+
+    now = time.monotonic()
+    cached = _cached_response
+    if cached is not None and now - cached[0] < HEALTH_CACHE_TTL_SECONDS:
+        return cached[1]
+
     logger.info("Health check requested")
 
-    # Perform checks
-    db_status = check_database()
-    gemini_status = check_gemini_api()
+    # Perform checks concurrently, off the event loop
+    db_status, gemini_status = await asyncio.gather(
+        run_check("database", check_database),
+        run_check("gemini_api", check_gemini_api),
+    )
 
     # Determine overall status
     overall_status: Literal["ok", "degraded"] = (
@@ -196,9 +271,15 @@ async def health_check() -> HealthCheckResponse:
         gemini_api=gemini_status,
     )
 
-    return HealthCheckResponse(
-        status=overall_status,
-        database=db_status,
-        gemini_api=gemini_status,
-        timestamp=timestamp,
-    )
+    response = {
+        "status": overall_status,
+        "database": db_status,
+        "gemini_api": gemini_status,
+        "timestamp": timestamp,
+    }
+
+    # Only cache healthy results so recoveries and failures show up promptly
+    if overall_status == "ok":
+        _cached_response = (now, response)
+
+    return response
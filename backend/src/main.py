@@ -10,29 +10,58 @@ This is the main entry point for the backend API. It:
 - Handles graceful startup and shutdown
 
 Run with: uvicorn src.main:app --reload
+     (or: uvicorn src.main:create_app --factory --reload)
+
+The application is built on first access to ``src.main.app`` (see
+``__getattr__`` below), so importing this module does not load settings.
 """
 
+import asyncio
+import importlib
 import sys
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator, Optional
 
-from fastapi import FastAPI
-from fastapi.responses import JSONResponse
+import orjson
+from fastapi import APIRouter, FastAPI, Request, Response
+from fastapi.responses import ORJSONResponse
 
 from src.api.routes import health
-from src.config import get_settings
-from src.middleware.cors_middleware import setup_cors
-from src.middleware.error_middleware import setup_error_handlers
+from src.config import Settings, get_settings
+from src.middleware import install_middleware
 from src.models import init_db
+from src.utils.api_log_writer import api_log_writer, maintain_api_log_partitions
 from src.utils.logger import get_logger, setup_logging
 
-# Initialize settings
-settings = get_settings()
-
-# Setup logging before anything else
-setup_logging(log_level=settings.log_level, log_format=settings.log_format)
 logger = get_logger(__name__)
 
+# Heavy modules needed by request handlers, imported in the background at startup
+PREWARM_MODULES = ("PyPDF2", "google.genai")
+
+
+async def prewarm_imports(modules: tuple[str, ...] = PREWARM_MODULES) -> None:
+    """Import heavy handler dependencies off the event loop.
+
+    Runs as a background task started by the lifespan, so the cold import
+    cost overlaps with the server starting to accept connections instead of
+    landing on the first request that needs the module. Failures are logged
+    and otherwise ignored; the module is imported normally on first use.
+
+    Args:
+        modules: Dotted module names to import
+    """
+    for module in modules:
+        try:
+            await asyncio.to_thread(importlib.import_module, module)
+        except Exception as e:
+            logger.warning(
+                "Failed to prewarm module",
+                module=module,
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+    logger.debug("Module prewarm complete", modules=modules)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator:
@@ -48,50 +77,61 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     Yields:
         None during application runtime
     """
+    settings = app.state.settings
+
     # ========================================================================
     # STARTUP
     # ========================================================================
-    logger.info(
-        "Starting application",
-        app_name=settings.app_name,
-        environment=settings.env,
-        debug=settings.debug,
-        version="1.0.0",
-    )
+    # Startup details are collected and logged as a single event on success
+    startup_info = {
+        "app_name": settings.app_name,
+        "environment": settings.env,
+        "debug": settings.debug,
+        "version": "1.0.0",
+    }
 
     try:
         # Initialize database connection
-        logger.info("Initializing database connection")
         init_db()
-        logger.info("Database initialized successfully")
 
-        # Log configuration summary
-        logger.info(
-            "Application configuration loaded",
+        # Configuration summary
+        startup_info.update(
             cors_origins=settings.cors_origins,
             max_upload_size_mb=settings.max_upload_size_bytes // (1024 * 1024),
             gemini_model=settings.gemini_model,
             cache_max_size_mb=settings.cache_max_size_mb,
         )
 
-        # Verify required directories exist
-        logger.info(
-            "Verified required directories",
+        # Create required directories (not done while loading settings)
+        for directory in (settings.upload_dir, settings.temp_dir):
+            directory.mkdir(parents=True, exist_ok=True)
+        startup_info.update(
             upload_dir=str(settings.upload_dir),
             temp_dir=str(settings.temp_dir),
         )
 
-        logger.info("Application startup complete")
+        logger.info("Application startup complete", **startup_info)
 
     except Exception as e:
         logger.critical(
             "Failed to start application",
+            **startup_info,
             error=str(e),
             error_type=type(e).__name__,
         )
         # Exit on critical startup failure
         sys.exit(1)
 
+    # Import heavy handler dependencies while the server starts accepting
+    # (the task is kept on app.state so it is not garbage collected)
+    app.state.prewarm_task = asyncio.create_task(prewarm_imports())
+
+    # Keep monthly api_logs partitions created ahead of time
+    app.state.partition_task = asyncio.create_task(maintain_api_log_partitions())
+
+    # Batch API log inserts in the background
+    await api_log_writer.start()
+
     # ========================================================================
     # RUNTIME (Application is running)
     # ========================================================================
@@ -102,7 +142,13 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
     # ========================================================================
     logger.info("Starting graceful shutdown")
 
+    app.state.prewarm_task.cancel()
+    app.state.partition_task.cancel()
+
     try:
+        # Write API log rows still queued (needs the database)
+        await api_log_writer.stop()
+
         # Close database connections
         logger.info("Closing database connections")
         # Note: SQLAlchemy engine will handle connection cleanup
@@ -118,98 +164,220 @@ async def lifespan(app: FastAPI) -> AsyncGenerator:
 
 
 # ============================================================================
-# CREATE FASTAPI APPLICATION
-# ============================================================================
-
-app = FastAPI(
-    title="PDF Summary & Mindmap API",
-    description=(
-        "Backend API for document processing with AI summaries and mindmaps. "
-        "Upload PDF documents, generate summaries and hierarchical mindmaps "
-        "using Google Gemini AI."
-    ),
-    version="1.0.0",
-    lifespan=lifespan,
-    docs_url="/docs" if settings.debug else None,  # Disable docs in production
-    redoc_url="/redoc" if settings.debug else None,
-    openapi_url="/openapi.json" if settings.debug else None,
-)
-
-
-# ============================================================================
-# CONFIGURE MIDDLEWARE
+# HEALTH CHECK ENDPOINT
 # ============================================================================
 
-# Setup CORS middleware (must be before other middleware)
-setup_cors(app, settings)
+# Top-level endpoints (registered on the app in create_app)
+router = APIRouter()
 
-# Setup error handling middleware
-setup_error_handlers(app, settings)
 
+def build_static_payloads(app: FastAPI, settings: Settings) -> dict[str, bytes]:
+    """Pre-render the JSON bodies of the top-level endpoints.
 
-# ============================================================================
-# HEALTH CHECK ENDPOINT
-# ============================================================================
+    Both payloads depend only on settings and app configuration, so they are
+    serialized once when the application is created instead of on every
+    request. ``docs_url`` is taken from the app, where the debug flag was
+    already applied, so the advertised link always matches the served docs.
 
+    Args:
+        app: FastAPI application instance
+        settings: Application settings
 
-@app.get("/health", tags=["Health"])
-async def health_check() -> JSONResponse:
+    Returns:
+        Mapping of endpoint name ("health", "root") to encoded JSON body
+    """
+    return {
+        "health": orjson.dumps(
+            {
+                "status": "ok",
+                "app_name": settings.app_name,
+                "environment": settings.env,
+                "version": "1.0.0",
+            }
+        ),
+        "root": orjson.dumps(
+            {
+                "message": "PDF Summary & Mindmap API",
+                "version": "1.0.0",
+                "docs_url": app.docs_url,
+                "health_check": "/health",
+                "detailed_health_check": "/api/health",
+            }
+        ),
+    }
+
+
+@router.get("/health", tags=["Health"])
+async def health_check(request: Request) -> Response:
     """Basic health check endpoint.
 
     This is a simple endpoint that returns OK if the application is running.
     For detailed health checks (database, Gemini API), see /api/health endpoint.
 
+    Args:
+        request: Incoming request
+
     Returns:
-        JSONResponse with health status
+        Response with the pre-rendered health status JSON
 
     Example:
         >>> response = await client.get("/health")
         >>> assert response.status_code == 200
         >>> assert response.json()["status"] == "ok"
     """
-    return JSONResponse(
-        status_code=200,
-        content={
-            "status": "ok",
-            "app_name": settings.app_name,
-            "environment": settings.env,
-            "version": "1.0.0",
-        },
+    return Response(
+        content=request.app.state.static_payloads["health"],
+        media_type="application/json",
     )
 
 
-@app.get("/", tags=["Root"])
-async def root() -> JSONResponse:
+@router.get("/", tags=["Root"])
+async def root(request: Request) -> Response:
     """Root endpoint with API information.
 
+    Args:
+        request: Incoming request
+
     Returns:
-        JSONResponse with API metadata and links
+        Response with the pre-rendered API metadata and links JSON
     """
-    return JSONResponse(
-        status_code=200,
-        content={
-            "message": "PDF Summary & Mindmap API",
-            "version": "1.0.0",
-            "docs_url": "/docs" if settings.debug else None,
-            "health_check": "/health",
-            "detailed_health_check": "/api/health",
-        },
+    return Response(
+        content=request.app.state.static_payloads["root"],
+        media_type="application/json",
     )
 
 
 # ============================================================================
-# REGISTER API ROUTES
+# OPENAPI SCHEMA
+# ============================================================================
+
+
+def setup_openapi_cache(app: FastAPI) -> None:
+    """Serve the OpenAPI schema from bytes encoded once on first request.
+
+    FastAPI memoizes the schema dict but re-encodes it on every request to
+    ``openapi_url``. This replaces that route with one that encodes the schema
+    with orjson once and then returns the cached bytes. Call it after all
+    routers are registered. Does nothing when ``openapi_url`` is disabled.
+
+    Note:
+        Unlike the built-in route, ``root_path`` is not added to ``servers``;
+        the API is not mounted under a proxy prefix.
+
+    Args:
+        app: FastAPI application instance
+    """
+    openapi_url = app.openapi_url
+    if openapi_url is None:
+        return
+
+    app.router.routes[:] = [
+        route
+        for route in app.router.routes
+        if getattr(route, "path", None) != openapi_url
+    ]
+
+    encoded: Optional[bytes] = None
+
+    async def openapi(request: Request) -> Response:
+        nonlocal encoded
+        if encoded is None:
+            encoded = orjson.dumps(app.openapi())
+        return Response(content=encoded, media_type="application/json")
+
+    app.add_route(openapi_url, openapi, include_in_schema=False)
+
+
+# ============================================================================
+# CREATE FASTAPI APPLICATION
 # ============================================================================
 
-# Register health check endpoint (detailed)
-app.include_router(health.router, prefix="/api")
 
-# TODO: Register additional route modules here as they are created:
-# Example:
-# from src.api.routes import documents, summaries, mindmaps
-# app.include_router(documents.router, prefix="/api", tags=["Documents"])
-# app.include_router(summaries.router, prefix="/api", tags=["Summaries"])
-# app.include_router(mindmaps.router, prefix="/api", tags=["Mindmaps"])
+def create_app() -> FastAPI:
+    """Build and configure the FastAPI application.
+
+    Loads settings, configures logging, installs middleware and registers
+    routes. Settings are only resolved here (and in request/lifespan code),
+    never at import time.
+
+    Returns:
+        Configured FastAPI application
+    """
+    settings = get_settings()
+
+    # Setup logging before anything else
+    setup_logging(log_level=settings.log_level, log_format=settings.log_format)
+
+    app = FastAPI(
+        title="PDF Summary & Mindmap API",
+        description=(
+            "Backend API for document processing with AI summaries and mindmaps. "
+            "Upload PDF documents, generate summaries and hierarchical mindmaps "
+            "using Google Gemini AI."
+        ),
+        version="1.0.0",
+        lifespan=lifespan,
+        default_response_class=ORJSONResponse,  # orjson for all JSON routes
+        docs_url="/docs" if settings.debug else None,  # Disable docs in production
+        redoc_url="/redoc" if settings.debug else None,
+        openapi_url="/openapi.json" if settings.debug else None,
+    )
+
+    # Expose settings to the lifespan handler
+    app.state.settings = settings
+    app.state.static_payloads = build_static_payloads(app, settings)
+
+    # ========================================================================
+    # CONFIGURE MIDDLEWARE
+    # ========================================================================
+
+    # CORS and error handling, in one pass
+    install_middleware(app, settings)
+
+    # ========================================================================
+    # REGISTER API ROUTES
+    # ========================================================================
+
+    # Basic health check and root endpoints
+    app.include_router(router)
+
+    # Register health check endpoint (detailed)
+    app.include_router(health.router, prefix="/api")
+
+    # TODO: Register additional route modules here as they are created:
+    # Example:
+    # from src.api.routes import documents, summaries, mindmaps
+    # app.include_router(documents.router, prefix="/api", tags=["Documents"])
+    # app.include_router(summaries.router, prefix="/api", tags=["Summaries"])
+    # app.include_router(mindmaps.router, prefix="/api", tags=["Mindmaps"])
+
+    # Serve the OpenAPI schema from cached bytes (needs all routes registered)
+    setup_openapi_cache(app)
+
+    return app
+
+
+def __getattr__(name: str) -> Any:
+    """Create the module-level ``app`` on first access.
+
+    Keeps ``uvicorn src.main:app`` and ``from src.main import app`` working
+    while deferring settings and application construction until the app is
+    actually needed.
+
+    Args:
+        name: Attribute being looked up on the module
+
+    Returns:
+        The FastAPI application for ``app``
+
+    Raises:
+        AttributeError: For any other missing attribute
+    """
+    if name == "app":
+        global app
+        app = create_app()
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # ============================================================================
@@ -217,13 +385,22 @@ app.include_router(health.router, prefix="/api")
 # ============================================================================
 
 if __name__ == "__main__":
+    import os
+
     import uvicorn
 
-    # Run with uvicorn programmatically (for development only)
+    settings = get_settings()
+    setup_logging(log_level=settings.log_level, log_format=settings.log_format)
+
+    # One reloading worker in debug, one worker per CPU otherwise
+    workers = 1 if settings.debug else (os.cpu_count() or 1)
+
+    # Run with uvicorn programmatically
     logger.info(
-        "Starting development server",
+        "Starting server",
         host=settings.server_host,
         port=settings.server_port,
+        workers=workers,
     )
 
     uvicorn.run(
@@ -231,6 +408,7 @@ if __name__ == "__main__":
         host=settings.server_host,
         port=settings.server_port,
         reload=settings.debug,
+        workers=workers,
         log_config=None,  # Use our custom logging setup
         access_log=settings.debug,
     )
@@ -3,10 +3,48 @@
 This package contains HTTP middleware for cross-cutting concerns:
 - CORS configuration for frontend-backend communication
 - Error handling and exception transformation
-- Request/response logging and monitoring
+- Request context (request ID, path, method) for log correlation
 """
 
+from fastapi import FastAPI
+
+from src.config import Settings
+from src.utils.logger import get_logger
+
 from .cors_middleware import setup_cors
 from .error_middleware import setup_error_handlers
+from .request_context_middleware import RequestContextMiddleware, get_request_context
+
+__all__ = [
+    "RequestContextMiddleware",
+    "get_request_context",
+    "install_middleware",
+    "setup_cors",
+    "setup_error_handlers",
+]
+
+logger = get_logger(__name__)
+
+
+def install_middleware(app: FastAPI, settings: Settings) -> None:
+    """Install all middleware and error handlers in one pass.
+
+    The request context middleware is added first (innermost) and CORS last
+    (outermost), so CORS wraps every response, including error responses
+    produced by the exception handlers. Emits a single summary log once
+    everything is installed.
+
+    Args:
+        app: FastAPI application instance
+        settings: Application settings
+    """
+    app.add_middleware(RequestContextMiddleware)
+    setup_cors(app, settings)
+    setup_error_handlers(app, settings)
 
-__all__ = ["setup_cors", "setup_error_handlers"]
+    logger.info(
+        "Middleware installed",
+        cors_origins=settings.cors_origins,
+        cors_allow_credentials=settings.cors_allow_credentials,
+        debug_mode=settings.debug,
+    )
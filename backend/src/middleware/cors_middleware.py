@@ -8,14 +8,57 @@ CORS settings are loaded from the application configuration (config.py)
 which reads from environment variables.
 """
 
+from typing import Any, Optional
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.types import ASGIApp
 
 from src.config import Settings
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# CORS policy constants (built once, shared by setup and summary)
+_ALLOW_METHODS = ("GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS")
+_ALLOW_HEADERS = (
+    "Content-Type",
+    "Authorization",
+    "Accept",
+    "Origin",
+    "User-Agent",
+    "DNT",
+    "Cache-Control",
+    "X-Requested-With",
+    "X-Request-ID",
+)
+_EXPOSE_HEADERS = (
+    "Content-Length",
+    "Content-Type",
+    "X-Request-ID",
+    "X-RateLimit-Limit",
+    "X-RateLimit-Remaining",
+    "X-RateLimit-Reset",
+)
+_MAX_AGE = 3600  # Cache preflight requests for 1 hour
+
+# (settings, summary) of the last get_cors_config_summary() call
+_cors_summary_cache: Optional[tuple[Settings, dict]] = None
+
+
+class FastCORSMiddleware(CORSMiddleware):
+    """CORSMiddleware that matches the Origin header against a frozenset.
+
+    Starlette keeps ``allow_origins`` as the given sequence and scans it for
+    every preflight and cross-origin request. Storing it as a frozenset makes
+    the membership test in ``is_allowed_origin`` a hash lookup; wildcard and
+    regex handling are inherited unchanged.
+    """
+
+    def __init__(self, app: ASGIApp, **kwargs: Any) -> None:
+        super().__init__(app, **kwargs)
+        self.allow_origins = frozenset(self.allow_origins)
+
 
 def setup_cors(app: FastAPI, settings: Settings) -> None:
     """Configure CORS middleware for the FastAPI application.
@@ -43,57 +86,49 @@ def setup_cors(app: FastAPI, settings: Settings) -> None:
     # Parse CORS origins from settings
     allowed_origins = settings.cors_origins
 
-    # Log CORS configuration for debugging
-    logger.info(
-        "Setting up CORS middleware",
-        allowed_origins=allowed_origins,
-        allow_credentials=settings.cors_allow_credentials,
-        environment=settings.env,
-    )
-
     # Add CORS middleware to FastAPI app
     app.add_middleware(
-        CORSMiddleware,
+        FastCORSMiddleware,
         allow_origins=allowed_origins,
         allow_credentials=settings.cors_allow_credentials,
-        allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
-        allow_headers=[
-            "Content-Type",
-            "Authorization",
-            "Accept",
-            "Origin",
-            "User-Agent",
-            "DNT",
-            "Cache-Control",
-            "X-Requested-With",
-            "X-Request-ID",
-        ],
-        expose_headers=[
-            "Content-Length",
-            "Content-Type",
-            "X-Request-ID",
-            "X-RateLimit-Limit",
-            "X-RateLimit-Remaining",
-            "X-RateLimit-Reset",
-        ],
-        max_age=3600,  # Cache preflight requests for 1 hour
+        allow_methods=_ALLOW_METHODS,
+        allow_headers=_ALLOW_HEADERS,
+        expose_headers=_EXPOSE_HEADERS,
+        max_age=_MAX_AGE,
     )
 
-    logger.info("CORS middleware configured successfully")
+    logger.debug(
+        "CORS middleware configured",
+        allowed_origins=allowed_origins,
+        allow_credentials=settings.cors_allow_credentials,
+        environment=settings.env,
+    )
 
 
 def get_cors_config_summary(settings: Settings) -> dict:
     """Get a summary of CORS configuration for monitoring/debugging.
 
+    Settings do not change after startup, so the summary is built once per
+    settings instance and the same dict is returned on later calls. Callers
+    must treat it as read-only.
+
     Args:
         settings: Application settings
 
     Returns:
         Dictionary with CORS configuration summary
     """
-    return {
+    global _cors_summary_cache
+
+    cached = _cors_summary_cache
+    if cached is not None and cached[0] is settings:
+        return cached[1]
+
+    summary = {
         "allowed_origins": settings.cors_origins,
         "allow_credentials": settings.cors_allow_credentials,
-        "allowed_methods": ["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
-        "max_age": 3600,
+        "allowed_methods": _ALLOW_METHODS,
+        "max_age": _MAX_AGE,
     }
+    _cors_summary_cache = (settings, summary)
+    return summary
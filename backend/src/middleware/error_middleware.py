@@ -12,32 +12,156 @@ The middleware ensures consistent error responses across all API endpoints
 and prevents internal error details from leaking to clients.
 """
 
-import traceback
+import re
+from typing import Any, Sequence
 
-from fastapi import FastAPI, Request, status
+import orjson
+from fastapi import FastAPI, HTTPException, Request, Response, status
 from fastapi.exceptions import RequestValidationError
-from fastapi.responses import JSONResponse
 from pydantic import ValidationError
 from sqlalchemy.exc import IntegrityError, OperationalError, SQLAlchemyError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from src.config import Settings
+from src.middleware.request_context_middleware import get_request_context
 from src.utils.error_handler import AppError, ErrorCode
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# ErrorCode string values used by the handlers, resolved once at import
+_EC_VALIDATION = ErrorCode.VALIDATION_ERROR.value
+_EC_AUTH = ErrorCode.AUTH_ERROR.value
+_EC_OPERATION_NOT_ALLOWED = ErrorCode.OPERATION_NOT_ALLOWED.value
+_EC_RECORD_NOT_FOUND = ErrorCode.RECORD_NOT_FOUND.value
+_EC_FILE_TOO_LARGE = ErrorCode.FILE_TOO_LARGE.value
+_EC_RATE_LIMITED = ErrorCode.RATE_LIMITED.value
+_EC_INTERNAL = ErrorCode.INTERNAL_ERROR.value
+_EC_API = ErrorCode.API_ERROR.value
+_EC_UNKNOWN = ErrorCode.UNKNOWN_ERROR.value
+_EC_DUPLICATE_RECORD = ErrorCode.DUPLICATE_RECORD.value
+_EC_DB = ErrorCode.DB_ERROR.value
+_EC_DB_CONNECTION = ErrorCode.DB_CONNECTION_ERROR.value
+
+# HTTP status code -> error code value for HTTPException responses
+_HTTP_ERROR_CODE_MAP: dict[int, str] = {
+    400: _EC_VALIDATION,
+    401: _EC_AUTH,
+    403: _EC_OPERATION_NOT_ALLOWED,
+    404: _EC_RECORD_NOT_FOUND,
+    413: _EC_FILE_TOO_LARGE,
+    429: _EC_RATE_LIMITED,
+    500: _EC_INTERNAL,
+    503: _EC_API,
+}
+
+# HTTP status codes reported as retryable
+_RETRYABLE_HTTP: frozenset[int] = frozenset((429, 500, 503))
+
+# Database error messages that indicate a duplicate record
+_DUPLICATE_RE = re.compile(r"unique|duplicate|already exists", re.IGNORECASE)
+
+
+def _format_validation_errors(errors: Sequence[Any]) -> tuple[dict[str, str], ...]:
+    """Flatten pydantic validation errors for the error response.
+
+    Args:
+        errors: Error dicts from ``exc.errors()`` (always carry loc/msg/type)
+
+    Returns:
+        One {"field", "message", "type"} dict per error
+    """
+    return tuple(
+        {
+            "field": ".".join(map(str, error["loc"])),
+            "message": error["msg"],
+            "type": error["type"],
+        }
+        for error in errors
+    )
+
+
+# Fixed shape of every error body; only the slot values vary per error
+_ERROR_BODY_TEMPLATE = (
+    b'{"error_code":"%b","message":%b,"details":%b,"is_retryable":%b}'
+)
+_EMPTY_DETAILS = b"{}"
+
+
+def _build_error_body(
+    error_code: str, message: str, details: dict[Any, Any], is_retryable: bool
+) -> bytes:
+    """Encode an error response body into the fixed error template.
+
+    Only the message and details are serialized; error codes are plain
+    identifiers and are written as-is. Details can carry arbitrary values
+    (AppError.details, debug info), so non-string keys are allowed and
+    unsupported types fall back to str() instead of failing while the error
+    is being reported.
+
+    Args:
+        error_code: ErrorCode value
+        message: User-facing error message
+        details: Additional error details
+        is_retryable: Whether the client may retry the request
+
+    Returns:
+        JSON-encoded body
+    """
+    return _ERROR_BODY_TEMPLATE % (
+        error_code.encode(),
+        orjson.dumps(message, default=str),
+        (
+            orjson.dumps(details, default=str, option=orjson.OPT_NON_STR_KEYS)
+            if details
+            else _EMPTY_DETAILS
+        ),
+        b"true" if is_retryable else b"false",
+    )
+
+
+def _error_response(
+    status_code: int,
+    *,
+    error_code: str,
+    message: str,
+    details: dict[Any, Any],
+    is_retryable: bool,
+) -> Response:
+    """Build a JSON error response from a prebuilt body.
+
+    Args:
+        status_code: HTTP status code
+        error_code: ErrorCode value
+        message: User-facing error message
+        details: Additional error details
+        is_retryable: Whether the client may retry the request
+
+    Returns:
+        Response with the encoded error body
+    """
+    return Response(
+        content=_build_error_body(error_code, message, details, is_retryable),
+        status_code=status_code,
+        media_type="application/json",
+    )
+
 
 def setup_error_handlers(app: FastAPI, settings: Settings) -> None:
     """Register error handlers for the FastAPI application.
 
     This function sets up exception handlers for various error types:
     - AppError: Custom application errors with error codes
-    - HTTPException: Starlette HTTP exceptions
+    - HTTPException: Starlette and FastAPI HTTP exceptions
     - RequestValidationError: Pydantic validation errors
     - SQLAlchemyError: Database errors
     - Exception: Catch-all for unexpected errors
 
+    Handlers are looked up by walking ``type(exc).__mro__``, so frequently
+    raised concrete classes (fastapi.HTTPException, IntegrityError,
+    OperationalError) are registered directly and resolve on the first probe.
+    WebSocketException keeps Starlette's built-in handler.
+
     Args:
         app: FastAPI application instance
         settings: Application settings (for debug mode, logging config)
@@ -51,10 +175,13 @@ def setup_error_handlers(app: FastAPI, settings: Settings) -> None:
         settings = get_settings()
         setup_error_handlers(app, settings)
     """
-    logger.info("Setting up error handlers", debug_mode=settings.debug)
+    # Read once; handlers close over the local instead of the settings object
+    debug: bool = bool(settings.debug)
+
+    logger.debug("Setting up error handlers", debug_mode=debug)
 
     @app.exception_handler(AppError)
-    async def app_error_handler(request: Request, exc: AppError) -> JSONResponse:
+    async def app_error_handler(request: Request, exc: AppError) -> Response:
         """Handle custom application errors (AppError).
 
         Args:
@@ -62,21 +189,16 @@ def setup_error_handlers(app: FastAPI, settings: Settings) -> None:
             exc: AppError exception instance
 
         Returns:
-            JSONResponse with structured error information
+            Response with structured error information
         """
         # Extract request context for logging
         context = {
-            "path": request.url.path,
-            "method": request.method,
+            **get_request_context(request),
             "error_code": exc.error_code.value,
             "status_code": exc.status_code,
             "is_retryable": exc.is_retryable,
         }
 
-        # Add request ID if present
-        if hasattr(request.state, "request_id"):
-            context["request_id"] = request.state.request_id
-
         # Log error with context
         logger.error(
             f"Application error: {exc.message}",
@@ -85,20 +207,18 @@ def setup_error_handlers(app: FastAPI, settings: Settings) -> None:
         )
 
         # Return structured error response
-        return JSONResponse(
-            status_code=exc.status_code,
-            content={
-                "error_code": exc.error_code.value,
-                "message": exc.message,
-                "details": exc.details,
-                "is_retryable": exc.is_retryable,
-            },
+        return _error_response(
+            exc.status_code,
+            error_code=exc.error_code.value,
+            message=exc.message,
+            details=exc.details,
+            is_retryable=exc.is_retryable,
         )
 
     @app.exception_handler(StarletteHTTPException)
     async def http_exception_handler(
         request: Request, exc: StarletteHTTPException
-    ) -> JSONResponse:
+    ) -> Response:
         """Handle HTTP exceptions from Starlette/FastAPI.
 
         Args:
@@ -106,45 +226,34 @@ def setup_error_handlers(app: FastAPI, settings: Settings) -> None:
             exc: StarletteHTTPException instance
 
         Returns:
-            JSONResponse with error information
+            Response with error information
         """
         # Map HTTP status codes to error codes
-        error_code_map = {
-            400: ErrorCode.VALIDATION_ERROR,
-            401: ErrorCode.AUTH_ERROR,
-            403: ErrorCode.OPERATION_NOT_ALLOWED,
-            404: ErrorCode.RECORD_NOT_FOUND,
-            413: ErrorCode.FILE_TOO_LARGE,
-            429: ErrorCode.RATE_LIMITED,
-            500: ErrorCode.INTERNAL_ERROR,
-            503: ErrorCode.API_ERROR,
-        }
-
-        error_code = error_code_map.get(exc.status_code, ErrorCode.UNKNOWN_ERROR)
+        error_code = _HTTP_ERROR_CODE_MAP.get(exc.status_code, _EC_UNKNOWN)
 
         # Log HTTP exception
         logger.warning(
             f"HTTP exception: {exc.detail}",
-            path=request.url.path,
-            method=request.method,
+            **get_request_context(request),
             status_code=exc.status_code,
-            error_code=error_code.value,
+            error_code=error_code,
         )
 
-        return JSONResponse(
-            status_code=exc.status_code,
-            content={
-                "error_code": error_code.value,
-                "message": str(exc.detail),
-                "details": {},
-                "is_retryable": exc.status_code in [429, 500, 503],
-            },
+        return _error_response(
+            exc.status_code,
+            error_code=error_code,
+            message=str(exc.detail),
+            details={},
+            is_retryable=exc.status_code in _RETRYABLE_HTTP,
         )
 
+    # Routes raise fastapi.HTTPException, a subclass; map it directly
+    app.add_exception_handler(HTTPException, http_exception_handler)
+
     @app.exception_handler(RequestValidationError)
     async def validation_exception_handler(
         request: Request, exc: RequestValidationError
-    ) -> JSONResponse:
+    ) -> Response:
         """Handle Pydantic validation errors from request body/params.
 
         Args:
@@ -152,41 +261,30 @@ def setup_error_handlers(app: FastAPI, settings: Settings) -> None:
             exc: RequestValidationError instance
 
         Returns:
-            JSONResponse with validation error details
+            Response with validation error details
         """
         # Extract validation error details
-        errors = exc.errors()
-        validation_details = [
-            {
-                "field": ".".join(str(loc) for loc in error.get("loc", [])),
-                "message": error.get("msg", "Validation error"),
-                "type": error.get("type", "value_error"),
-            }
-            for error in errors
-        ]
+        validation_details = _format_validation_errors(exc.errors())
 
         # Log validation error
         logger.warning(
             "Request validation error",
-            path=request.url.path,
-            method=request.method,
+            **get_request_context(request),
             validation_errors=validation_details,
         )
 
-        return JSONResponse(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            content={
-                "error_code": ErrorCode.VALIDATION_ERROR.value,
-                "message": "Request validation failed",
-                "details": {"validation_errors": validation_details},
-                "is_retryable": False,
-            },
+        return _error_response(
+            status.HTTP_422_UNPROCESSABLE_ENTITY,
+            error_code=_EC_VALIDATION,
+            message="Request validation failed",
+            details={"validation_errors": validation_details},
+            is_retryable=False,
         )
 
     @app.exception_handler(ValidationError)
     async def pydantic_validation_error_handler(
         request: Request, exc: ValidationError
-    ) -> JSONResponse:
+    ) -> Response:
         """Handle Pydantic validation errors from models.
 
         Args:
@@ -194,41 +292,30 @@ def setup_error_handlers(app: FastAPI, settings: Settings) -> None:
             exc: ValidationError instance
 
         Returns:
-            JSONResponse with validation error details
+            Response with validation error details
         """
         # Extract validation error details
-        errors = exc.errors()
-        validation_details = [
-            {
-                "field": ".".join(str(loc) for loc in error.get("loc", [])),
-                "message": error.get("msg", "Validation error"),
-                "type": error.get("type", "value_error"),
-            }
-            for error in errors
-        ]
+        validation_details = _format_validation_errors(exc.errors())
 
         # Log validation error
         logger.warning(
             "Pydantic validation error",
-            path=request.url.path,
-            method=request.method,
+            **get_request_context(request),
             validation_errors=validation_details,
         )
 
-        return JSONResponse(
-            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-            content={
-                "error_code": ErrorCode.VALIDATION_ERROR.value,
-                "message": "Data validation failed",
-                "details": {"validation_errors": validation_details},
-                "is_retryable": False,
-            },
+        return _error_response(
+            status.HTTP_422_UNPROCESSABLE_ENTITY,
+            error_code=_EC_VALIDATION,
+            message="Data validation failed",
+            details={"validation_errors": validation_details},
+            is_retryable=False,
         )
 
     @app.exception_handler(IntegrityError)
     async def integrity_error_handler(
         request: Request, exc: IntegrityError
-    ) -> JSONResponse:
+    ) -> Response:
         """Handle database integrity constraint violations.
 
         Args:
@@ -236,24 +323,20 @@ def setup_error_handlers(app: FastAPI, settings: Settings) -> None:
             exc: IntegrityError instance
 
         Returns:
-            JSONResponse with appropriate error code
+            Response with appropriate error code
         """
-        error_message = str(exc.orig) if hasattr(exc, "orig") else str(exc)
+        error_message = str(getattr(exc, "orig", None) or exc)
 
         # Determine if it's a duplicate record error
-        is_duplicate = any(
-            keyword in error_message.lower()
-            for keyword in ["unique", "duplicate", "already exists"]
-        )
+        is_duplicate = _DUPLICATE_RE.search(error_message) is not None
 
-        error_code = ErrorCode.DUPLICATE_RECORD if is_duplicate else ErrorCode.DB_ERROR
+        error_code = _EC_DUPLICATE_RECORD if is_duplicate else _EC_DB
 
         # Log database error
         logger.error(
             "Database integrity error",
-            path=request.url.path,
-            method=request.method,
-            error_code=error_code.value,
+            **get_request_context(request),
+            error_code=error_code,
             error_message=error_message,
         )
 
@@ -264,22 +347,22 @@ def setup_error_handlers(app: FastAPI, settings: Settings) -> None:
             else "Database constraint violation"
         )
 
-        return JSONResponse(
-            status_code=status.HTTP_409_CONFLICT
-            if is_duplicate
-            else status.HTTP_500_INTERNAL_SERVER_ERROR,
-            content={
-                "error_code": error_code.value,
-                "message": user_message,
-                "details": {} if not settings.debug else {"db_error": error_message},
-                "is_retryable": False,
-            },
+        return _error_response(
+            (
+                status.HTTP_409_CONFLICT
+                if is_duplicate
+                else status.HTTP_500_INTERNAL_SERVER_ERROR
+            ),
+            error_code=error_code,
+            message=user_message,
+            details={} if not debug else {"db_error": error_message},
+            is_retryable=False,
         )
 
     @app.exception_handler(OperationalError)
     async def operational_error_handler(
         request: Request, exc: OperationalError
-    ) -> JSONResponse:
+    ) -> Response:
         """Handle database operational errors (connection, timeout, etc.).
 
         Args:
@@ -287,32 +370,29 @@ def setup_error_handlers(app: FastAPI, settings: Settings) -> None:
             exc: OperationalError instance
 
         Returns:
-            JSONResponse with database error information
+            Response with database error information
         """
-        error_message = str(exc.orig) if hasattr(exc, "orig") else str(exc)
+        error_message = str(getattr(exc, "orig", None) or exc)
 
         # Log database error
         logger.error(
             "Database operational error",
-            path=request.url.path,
-            method=request.method,
+            **get_request_context(request),
             error_message=error_message,
         )
 
-        return JSONResponse(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            content={
-                "error_code": ErrorCode.DB_CONNECTION_ERROR.value,
-                "message": "Database connection error",
-                "details": {} if not settings.debug else {"db_error": error_message},
-                "is_retryable": True,
-            },
+        return _error_response(
+            status.HTTP_503_SERVICE_UNAVAILABLE,
+            error_code=_EC_DB_CONNECTION,
+            message="Database connection error",
+            details={} if not debug else {"db_error": error_message},
+            is_retryable=True,
         )
 
     @app.exception_handler(SQLAlchemyError)
     async def sqlalchemy_error_handler(
         request: Request, exc: SQLAlchemyError
-    ) -> JSONResponse:
+    ) -> Response:
         """Handle generic SQLAlchemy errors.
 
         Args:
@@ -320,32 +400,27 @@ def setup_error_handlers(app: FastAPI, settings: Settings) -> None:
             exc: SQLAlchemyError instance
 
         Returns:
-            JSONResponse with database error information
+            Response with database error information
         """
         error_message = str(exc)
 
         # Log database error
         logger.error(
             "SQLAlchemy error",
-            path=request.url.path,
-            method=request.method,
+            **get_request_context(request),
             error_message=error_message,
         )
 
-        return JSONResponse(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            content={
-                "error_code": ErrorCode.DB_ERROR.value,
-                "message": "Database error occurred",
-                "details": {} if not settings.debug else {"db_error": error_message},
-                "is_retryable": True,
-            },
+        return _error_response(
+            status.HTTP_500_INTERNAL_SERVER_ERROR,
+            error_code=_EC_DB,
+            message="Database error occurred",
+            details={} if not debug else {"db_error": error_message},
+            is_retryable=True,
         )
 
     @app.exception_handler(Exception)
-    async def generic_exception_handler(
-        request: Request, exc: Exception
-    ) -> JSONResponse:
+    async def generic_exception_handler(request: Request, exc: Exception) -> Response:
         """Catch-all handler for unexpected exceptions.
 
         This handler ensures that no unhandled exceptions leak to the client
@@ -356,33 +431,29 @@ def setup_error_handlers(app: FastAPI, settings: Settings) -> None:
             exc: Exception instance
 
         Returns:
-            JSONResponse with generic error information
+            Response with generic error information
         """
-        # Log full exception with traceback
+        exception_type = type(exc).__name__
+
+        # Log exception; the traceback (debug only) is formatted by the
+        # format_exc_info processor only if the record is emitted
         logger.error(
             f"Unhandled exception: {exc}",
-            path=request.url.path,
-            method=request.method,
-            exception_type=type(exc).__name__,
-            traceback=traceback.format_exc() if settings.debug else None,
+            **get_request_context(request),
+            exception_type=exception_type,
+            exc_info=exc if debug else False,
         )
 
         # Return generic error response (don't leak internal details)
-        return JSONResponse(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            content={
-                "error_code": ErrorCode.INTERNAL_ERROR.value,
-                "message": "An unexpected error occurred",
-                "details": (
-                    {"exception": str(exc), "type": type(exc).__name__}
-                    if settings.debug
-                    else {}
-                ),
-                "is_retryable": False,
-            },
+        return _error_response(
+            status.HTTP_500_INTERNAL_SERVER_ERROR,
+            error_code=_EC_INTERNAL,
+            message="An unexpected error occurred",
+            details={"exception": str(exc), "type": exception_type} if debug else {},
+            is_retryable=False,
         )
 
-    logger.info("Error handlers configured successfully")
+    logger.debug("Error handlers configured successfully")
 
 
 def get_error_handler_summary() -> dict:
@@ -395,6 +466,7 @@ def get_error_handler_summary() -> dict:
         "handlers": [
             "AppError",
             "StarletteHTTPException",
+            "HTTPException",
             "RequestValidationError",
             "ValidationError",
             "IntegrityError",
@@ -0,0 +1,92 @@
+"""Request context middleware for log correlation.
+
+This module provides a lightweight ASGI middleware that, once per request:
+- Resolves a request ID (from the X-Request-ID header or a new random one)
+- Stores a prebuilt context dict (path, method, request_id) on request.state
+- Echoes the request ID back in the X-Request-ID response header
+
+Error handlers and other logging code read the prebuilt dict instead of
+re-reading the URL and headers for every log call.
+"""
+
+from typing import Any, Optional
+from uuid import uuid4
+
+from fastapi import Request
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Header carrying the request ID (lowercase, as it appears in ASGI scopes)
+REQUEST_ID_HEADER = b"x-request-id"
+
+# Incoming request IDs longer than this are replaced with a generated one
+MAX_REQUEST_ID_LENGTH = 64
+
+
+class RequestContextMiddleware:
+    """Pure ASGI middleware that builds the per-request logging context.
+
+    The context is stored in ``scope["state"]`` under ``request_context`` (so
+    it is visible as ``request.state.request_context``) and the request ID is
+    also exposed as ``request.state.request_id``.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = _resolve_request_id(scope)
+        state = scope.setdefault("state", {})
+        state["request_id"] = request_id
+        state["request_context"] = {
+            "path": scope["path"],
+            "method": scope["method"],
+            "request_id": request_id,
+        }
+
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers["X-Request-ID"] = request_id
+            await send(message)
+
+        await self.app(scope, receive, send_with_request_id)
+
+
+def _resolve_request_id(scope: Scope) -> str:
+    """Return the client-supplied request ID or generate a new one.
+
+    Args:
+        scope: ASGI HTTP scope
+
+    Returns:
+        Request ID string
+    """
+    for name, value in scope["headers"]:
+        if name == REQUEST_ID_HEADER:
+            if 0 < len(value) <= MAX_REQUEST_ID_LENGTH:
+                return value.decode("latin-1")
+            break
+    return uuid4().hex
+
+
+def get_request_context(request: Request) -> dict[str, Any]:
+    """Get the logging context for a request.
+
+    Returns the dict prebuilt by RequestContextMiddleware, or a minimal
+    path/method dict when the middleware is not installed.
+
+    Args:
+        request: Incoming request
+
+    Returns:
+        Dictionary with path, method and (if available) request_id
+    """
+    context: Optional[dict[str, Any]] = getattr(request.state, "request_context", None)
+    if context is None:
+        context = {"path": request.url.path, "method": request.method}
+    return context
@@ -53,12 +53,18 @@ def get_engine() -> Engine:
         settings = get_settings()
 
         _engine = create_engine(
-            str(settings.database_url),
+            str(settings.database_dsn),
             pool_size=settings.db_pool_size,
             max_overflow=settings.db_pool_max_overflow,
             pool_timeout=settings.db_pool_timeout,
-            pool_pre_ping=True,  # Verify connections before using
+            # Replace connections before server/proxy idle timeouts instead of
+            # pinging on every checkout; a connection found dead mid-query
+            # invalidates the pool so the next checkout reconnects.
+            pool_recycle=settings.db_pool_recycle,
+            pool_pre_ping=settings.db_pool_pre_ping,
             echo=settings.db_echo,  # SQL logging for debugging
+            # Identify our sessions in pg_stat_activity and server logs
+            connect_args={"application_name": settings.app_name},
         )
 
     return _engine
@@ -68,10 +74,13 @@ def get_engine() -> Engine:
 # SESSION FACTORY
 # ============================================================================
 
-# Session factory for creating database sessions
+# Session factory for creating database sessions. Objects stay loaded after
+# commit (expire_on_commit=False) so reading them afterwards, e.g. to build a
+# response, does not trigger a refresh SELECT per object.
 SessionLocal = sessionmaker(
     autocommit=False,
     autoflush=False,
+    expire_on_commit=False,
     bind=None,  # Will be bound when engine is available
 )
 
@@ -164,7 +173,9 @@ def get_db_context() -> Generator[Session, None, None]:
 # This is REQUIRED for Alembic to detect models for auto-migration generation
 from .api_log import APILog  # noqa: E402
 from .document import Document  # noqa: E402
+from .document_text import DocumentText  # noqa: E402
 from .mindmap import Mindmap  # noqa: E402
+from .status import GenerationStatus  # noqa: E402
 from .summary import Summary  # noqa: E402
 from .user import User  # noqa: E402
 
@@ -185,7 +196,10 @@ __all__ = [
     # Models
     "User",
     "Document",
+    "DocumentText",
     "Summary",
     "Mindmap",
     "APILog",
+    # Status values
+    "GenerationStatus",
 ]
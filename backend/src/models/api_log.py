@@ -4,7 +4,16 @@ from datetime import datetime
 from decimal import Decimal
 from typing import Optional
 
-from sqlalchemy import DECIMAL, CheckConstraint, ForeignKey, Integer, String, func
+from sqlalchemy import (
+    DECIMAL,
+    CheckConstraint,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    func,
+    text,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from . import Base
@@ -15,7 +24,7 @@ class APILog(Base):
 
     __tablename__ = "api_logs"
 
-    # Primary key
+    # Primary key (must include the partition key, see created_at)
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
 
     # Foreign key to document (nullable for metadata calls)
@@ -52,7 +61,6 @@ class APILog(Base):
     status: Mapped[str] = mapped_column(
         String(20),
         nullable=False,
-        index=True,
         comment="'success', 'rate_limited', 'timeout', 'error'",
     )
     error_code: Mapped[Optional[str]] = mapped_column(
@@ -61,11 +69,11 @@ class APILog(Base):
         comment="'RATE_LIMIT', 'TIMEOUT', 'AUTH_ERROR', etc.",
     )
 
-    # Timestamp
+    # Timestamp (monthly RANGE partition key)
     created_at: Mapped[datetime] = mapped_column(
+        primary_key=True,
         nullable=False,
         server_default=func.now(),
-        index=True,
         comment="Request timestamp",
     )
 
@@ -85,6 +93,21 @@ class APILog(Base):
         ),
         CheckConstraint("cost_usd >= 0", name="ck_apilog_cost_positive"),
         CheckConstraint("latency_ms >= 0", name="ck_apilog_latency_positive"),
+        # Append-only, time-ordered: BRIN summaries instead of a B-tree
+        Index(
+            "ix_api_logs_created_at_brin",
+            "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        # Error triage: successful calls are not indexed
+        Index(
+            "ix_api_logs_failed",
+            "created_at",
+            postgresql_where=text("status IN ('rate_limited', 'timeout', 'error')"),
+        ),
+        # Monthly partitions are created by create_api_logs_partition()
+        {"postgresql_partition_by": "RANGE (created_at)"},
     )
 
     def __repr__(self) -> str:
@@ -1,18 +1,20 @@
 """Document model for PDF metadata and processing status."""
 
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import Optional
 
 from sqlalchemy import (
+    BigInteger,
     CheckConstraint,
-    Enum,
     ForeignKey,
     Index,
     Integer,
+    LargeBinary,
     String,
     Text,
     UniqueConstraint,
     func,
+    text,
 )
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -28,9 +30,9 @@ class Document(Base):
     # Primary key
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
 
-    # Foreign key to user
+    # Foreign key to user (indexed via ix_documents_user_created)
     user_id: Mapped[int] = mapped_column(
-        ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True
+        ForeignKey("users.id", ondelete="CASCADE"), nullable=False
     )
 
     # File information
@@ -41,19 +43,18 @@ class Document(Base):
         Text, nullable=False, comment="Full path to stored file (local or S3)"
     )
     file_size_bytes: Mapped[int] = mapped_column(
-        Integer, nullable=False, comment="Size for quota enforcement"
+        BigInteger, nullable=False, comment="Size for quota enforcement"
     )
-    file_hash: Mapped[str] = mapped_column(
-        String(64), nullable=False, comment="SHA-256 hash for deduplication"
+    file_hash: Mapped[bytes] = mapped_column(
+        LargeBinary(32),
+        nullable=False,
+        comment="Raw SHA-256 digest (32 bytes) for deduplication",
     )
 
     # Parsed document data
     page_count: Mapped[Optional[int]] = mapped_column(
         Integer, nullable=True, comment="Number of pages (extracted during parse)"
     )
-    extracted_text: Mapped[Optional[str]] = mapped_column(
-        Text, nullable=True, comment="Full document text (for full-text search)"
-    )
     pdf_metadata: Mapped[Optional[dict]] = mapped_column(
         "metadata",  # Column name in database
         JSONB,
@@ -63,10 +64,9 @@ class Document(Base):
 
     # Processing status
     upload_status: Mapped[str] = mapped_column(
-        Enum("uploading", "parsing", "ready", "failed", name="upload_status_enum"),
+        String(16),
         nullable=False,
         server_default="uploading",
-        index=True,
         comment="States: uploading, parsing, ready, failed",
     )
     error_message: Mapped[Optional[str]] = mapped_column(
@@ -88,10 +88,13 @@ class Document(Base):
     )
     expires_at: Mapped[datetime] = mapped_column(
         nullable=False,
-        default=lambda: datetime.utcnow() + timedelta(days=30),
+        server_default=text("(now() + interval '30 days')"),
         index=True,
         comment="Auto-delete date (30 days from upload)",
     )
+    deleted_at: Mapped[Optional[datetime]] = mapped_column(
+        nullable=True, comment="Soft delete flag"
+    )
 
     # Relationships
     user: Mapped["User"] = relationship("User", back_populates="documents")
@@ -101,6 +104,15 @@ class Document(Base):
         cascade="all, delete-orphan",
         uselist=False,
     )
+    # Extracted text lives in document_texts; load it explicitly
+    # (selectinload/joinedload) so plain document queries never touch it
+    document_text: Mapped[Optional["DocumentText"]] = relationship(
+        "DocumentText",
+        back_populates="document",
+        cascade="all, delete-orphan",
+        uselist=False,
+        lazy="raise",
+    )
     mindmap: Mapped[Optional["Mindmap"]] = relationship(
         "Mindmap",
         back_populates="document",
@@ -117,7 +129,38 @@ class Document(Base):
         CheckConstraint(
             "file_size_bytes <= 104857600", name="ck_document_max_size"
         ),  # 100 MB
+        CheckConstraint(
+            "upload_status IN ('uploading', 'parsing', 'ready', 'failed')",
+            name="ck_document_upload_status",
+        ),
+        # LargeBinary(32) is plain bytea in PostgreSQL; enforce the digest size
+        CheckConstraint(
+            "octet_length(file_hash) = 32", name="ck_document_file_hash_length"
+        ),
         Index("ix_documents_user_created", "user_id", "created_at"),
+        # Dashboard listing: index-only scan over live documents, newest first
+        Index(
+            "ix_documents_user_list",
+            "user_id",
+            text("created_at DESC"),
+            postgresql_include=["filename", "upload_status"],
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        # Worker pickup: only non-terminal rows are indexed
+        Index(
+            "ix_documents_pending",
+            "created_at",
+            postgresql_where=text(
+                "upload_status IN ('uploading', 'parsing', 'failed')"
+            ),
+        ),
+        # Containment lookups: Document.pdf_metadata.contains({"author": ...})
+        Index(
+            "ix_documents_metadata_gin",
+            "metadata",
+            postgresql_using="gin",
+            postgresql_ops={"metadata": "jsonb_path_ops"},
+        ),
     )
 
     def __repr__(self) -> str:
@@ -0,0 +1,58 @@
+"""DocumentText model for extracted PDF text (cold sidecar of documents)."""
+
+from typing import Optional
+
+from sqlalchemy import Computed, ForeignKey, Index, Text
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from . import Base
+
+
+class DocumentText(Base):
+    """Full extracted text of a document (1:1 with Document).
+
+    Kept out of the documents table so scans over hot status/expiry columns
+    never drag megabytes of text (or its TOAST chain) through the buffer cache.
+
+    extracted_text and extracted_tsv are TOAST-compressed with lz4 (set by
+    migration 015), so the text is stored compressed and decompressed
+    cheaply inside PostgreSQL; the generated tsvector keeps working on it.
+    """
+
+    __tablename__ = "document_texts"
+
+    # Primary key / foreign key to document (1:1 relationship)
+    document_id: Mapped[int] = mapped_column(
+        ForeignKey("documents.id", ondelete="CASCADE"), primary_key=True
+    )
+
+    # Parsed document text
+    extracted_text: Mapped[Optional[str]] = mapped_column(
+        Text, nullable=True, comment="Full document text (for full-text search)"
+    )
+    extracted_tsv: Mapped[Optional[str]] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "to_tsvector('english', coalesce(extracted_text, ''))", persisted=True
+        ),
+        nullable=True,
+        comment="Generated tsvector of extracted_text for full-text search",
+    )
+
+    # Relationships
+    document: Mapped["Document"] = relationship(
+        "Document", back_populates="document_text"
+    )
+
+    # Table constraints
+    __table_args__ = (
+        # Full-text search: extracted_tsv @@ plainto_tsquery('english', :q)
+        Index(
+            "ix_document_texts_extracted_tsv", "extracted_tsv", postgresql_using="gin"
+        ),
+    )
+
+    def __repr__(self) -> str:
+        """String representation of DocumentText."""
+        return f"<DocumentText(document_id={self.document_id})>"
@@ -3,11 +3,26 @@
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Enum, ForeignKey, Integer, Text, func
+from sqlalchemy import (
+    CheckConstraint,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    func,
+    text,
+)
 from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from . import Base
+from .status import (
+    GENERATION_STATUS_SQL,
+    PENDING_GENERATION_STATUS_SQL,
+    GenerationStatus,
+)
 
 
 class Mindmap(Base):
@@ -35,10 +50,9 @@ class Mindmap(Base):
 
     # Processing status
     generation_status: Mapped[str] = mapped_column(
-        Enum("queued", "generating", "complete", "failed", name="mindmap_status_enum"),
+        String(16),
         nullable=False,
-        server_default="queued",
-        index=True,
+        server_default=GenerationStatus.QUEUED.value,
         comment="States: queued, generating, complete, failed",
     )
     error_message: Mapped[Optional[str]] = mapped_column(
@@ -73,6 +87,37 @@ class Mindmap(Base):
     # Relationships
     document: Mapped["Document"] = relationship("Document", back_populates="mindmap")
 
+    # Table constraints
+    __table_args__ = (
+        CheckConstraint(
+            f"generation_status IN ({GENERATION_STATUS_SQL})",
+            name="ck_mindmap_generation_status",
+        ),
+        # Worker pickup: only non-terminal rows are indexed
+        Index(
+            "ix_mindmaps_pending",
+            "created_at",
+            postgresql_where=text(
+                f"generation_status IN ({PENDING_GENERATION_STATUS_SQL})"
+            ),
+        ),
+    )
+
+    @hybrid_property
+    def title(self) -> Optional[str]:
+        """Root title of the mindmap.
+
+        On an instance this reads the loaded mindmap_json. In a query it
+        compiles to ``mindmap_json ->> 'title'``, so ``select(Mindmap.title)``
+        fetches only the title instead of transferring and parsing the blob.
+        """
+        return (self.mindmap_json or {}).get("title")
+
+    @title.inplace.expression
+    @classmethod
+    def _title_expression(cls):
+        return cls.mindmap_json["title"].astext
+
     def __repr__(self) -> str:
         """String representation of Mindmap."""
         return (
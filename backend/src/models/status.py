@@ -0,0 +1,25 @@
+"""Processing status values shared by the generation models."""
+
+from enum import Enum
+
+
+class GenerationStatus(str, Enum):
+    """Lifecycle of a generated summary or mindmap.
+
+    Stored as plain VARCHAR guarded by a CHECK constraint (no native
+    PostgreSQL enum type), so the Python enum is the single list of states.
+    """
+
+    QUEUED = "queued"
+    GENERATING = "generating"
+    COMPLETE = "complete"
+    FAILED = "failed"
+
+
+# SQL literal lists for CHECK constraints and partial index predicates
+GENERATION_STATUS_SQL = ", ".join(f"'{status.value}'" for status in GenerationStatus)
+PENDING_GENERATION_STATUS_SQL = ", ".join(
+    f"'{status.value}'"
+    for status in GenerationStatus
+    if status is not GenerationStatus.COMPLETE
+)
@@ -1,12 +1,31 @@
 """Summary model for generated document summaries."""
 
 from datetime import datetime
-from typing import Optional
+from typing import Any, Optional, Sequence
 
-from sqlalchemy import Enum, ForeignKey, Integer, Text, UniqueConstraint, func
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import (
+    CheckConstraint,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+    UniqueConstraint,
+    func,
+    text,
+)
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Mapped, Session, mapped_column, relationship, validates
 
 from . import Base
+from .status import (
+    GENERATION_STATUS_SQL,
+    PENDING_GENERATION_STATUS_SQL,
+    GenerationStatus,
+)
+
+# Longer error messages (e.g. with stack traces) are truncated on assignment
+ERROR_MESSAGE_MAX_LENGTH = 2000
 
 
 class Summary(Base):
@@ -34,16 +53,15 @@ class Summary(Base):
 
     # Processing status
     generation_status: Mapped[str] = mapped_column(
-        Enum(
-            "queued", "generating", "complete", "failed", name="generation_status_enum"
-        ),
+        String(16),
         nullable=False,
-        server_default="queued",
-        index=True,
+        server_default=GenerationStatus.QUEUED.value,
         comment="States: queued, generating, complete, failed",
     )
     error_message: Mapped[Optional[str]] = mapped_column(
-        Text, nullable=True, comment="Error detail if generation fails"
+        String(ERROR_MESSAGE_MAX_LENGTH),
+        nullable=True,
+        comment="Error detail if generation fails (truncated)",
     )
 
     # API metrics (for cost tracking and monitoring)
@@ -72,7 +90,61 @@ class Summary(Base):
     )
 
     # Relationships
-    document: Mapped["Document"] = relationship("Document", back_populates="summary")
+    # document_id is NOT NULL, so the document is loaded with an inner join
+    document: Mapped["Document"] = relationship(
+        "Document", back_populates="summary", lazy="joined", innerjoin=True
+    )
+
+    # Table constraints
+    __table_args__ = (
+        CheckConstraint(
+            f"generation_status IN ({GENERATION_STATUS_SQL})",
+            name="ck_summary_generation_status",
+        ),
+        CheckConstraint(
+            "tokens_input >= 0 AND tokens_output >= 0 AND latency_ms >= 0",
+            name="ck_summary_metrics_non_negative",
+        ),
+        # Worker pickup (WHERE generation_status = :s ORDER BY created_at
+        # LIMIT n): only non-terminal rows are indexed, grouped by status
+        Index(
+            "ix_summaries_status_created",
+            "generation_status",
+            "created_at",
+            postgresql_where=text(
+                f"generation_status IN ({PENDING_GENERATION_STATUS_SQL})"
+            ),
+        ),
+    )
+
+    @validates("error_message")
+    def _truncate_error_message(self, key: str, value: Optional[str]) -> Optional[str]:
+        """Cap error_message at ERROR_MESSAGE_MAX_LENGTH characters."""
+        if value is not None and len(value) > ERROR_MESSAGE_MAX_LENGTH:
+            return value[:ERROR_MESSAGE_MAX_LENGTH]
+        return value
+
+    @classmethod
+    def bulk_insert(cls, session: Session, rows: Sequence[dict[str, Any]]) -> None:
+        """Insert many summaries in one batched statement.
+
+        Rows go through a Core executemany INSERT (sent as multi-row VALUES
+        batches, no per-row RETURNING) instead of one ORM flush per object.
+        Rows for documents that already have a summary are skipped, so a
+        backfill can be replayed safely. created_at/updated_at default to
+        now(), which is the same for every row of the transaction. ORM
+        validators (error_message truncation) do not run for these rows.
+
+        Args:
+            session: Database session (the caller commits)
+            rows: Summary column values, each including document_id
+        """
+        if not rows:
+            return
+        statement = insert(cls.__table__).on_conflict_do_nothing(
+            index_elements=["document_id"]
+        )
+        session.execute(statement, rows)
 
     def __repr__(self) -> str:
         """String representation of Summary."""
@@ -3,7 +3,7 @@
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import String, func
+from sqlalchemy import Index, String, func, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from . import Base
@@ -20,10 +20,8 @@ class User(Base):
     # User credentials and profile
     email: Mapped[str] = mapped_column(
         String(255),
-        unique=True,
         nullable=False,
-        index=True,
-        comment="Email for authentication",
+        comment="Email for authentication (unique among active users)",
     )
     name: Mapped[str] = mapped_column(
         String(255), nullable=False, comment="User display name"
@@ -44,8 +42,26 @@ class User(Base):
     )
 
     # Relationships
+    # Lazy by default; queries that list documents use selectinload(User.documents)
     documents: Mapped[list["Document"]] = relationship(
-        "Document", back_populates="user", cascade="all, delete-orphan"
+        "Document",
+        back_populates="user",
+        cascade="all, delete-orphan",
+    )
+
+    # Table constraints (partial indexes skip soft-deleted / live rows)
+    __table_args__ = (
+        Index(
+            "ix_users_active_email",
+            "email",
+            unique=True,
+            postgresql_where=text("deleted_at IS NULL"),
+        ),
+        Index(
+            "ix_users_deleted_at",
+            "deleted_at",
+            postgresql_where=text("deleted_at IS NOT NULL"),
+        ),
     )
 
     def __repr__(self) -> str:
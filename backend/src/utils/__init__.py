@@ -1,17 +1,38 @@
-"""Utility modules for the backend application."""
+"""Utility modules for the backend application.
 
-from .error_handler import AppError, ErrorCode, retry_with_backoff
+Re-exports are resolved lazily (PEP 562 ``__getattr__``): importing one
+submodule, e.g. ``src.utils.logger``, does not also import the others.
+"""
 
-from .logger import get_logger, setup_logging
+import importlib
+from typing import TYPE_CHECKING, Any
 
-from .validators import (
-    ValidationError,
-    validate_file_size,
-    validate_filename,
-    validate_mime_type,
-    validate_pdf_format,
-    validate_pdf_upload,
-)
+if TYPE_CHECKING:
+    from .error_handler import AppError, ErrorCode, retry_with_backoff
+    from .logger import get_logger, setup_logging
+    from .validators import (
+        ValidationError,
+        validate_file_size,
+        validate_filename,
+        validate_mime_type,
+        validate_pdf_format,
+        validate_pdf_upload,
+    )
+
+# Exported name -> submodule that defines it
+_EXPORTS: dict[str, str] = {
+    "ValidationError": "validators",
+    "validate_file_size": "validators",
+    "validate_mime_type": "validators",
+    "validate_filename": "validators",
+    "validate_pdf_format": "validators",
+    "validate_pdf_upload": "validators",
+    "ErrorCode": "error_handler",
+    "AppError": "error_handler",
+    "retry_with_backoff": "error_handler",
+    "get_logger": "logger",
+    "setup_logging": "logger",
+}
 
 __all__ = [
     "ValidationError",
@@ -26,3 +47,31 @@ __all__ = [
     "get_logger",
     "setup_logging",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the submodule defining an exported name on first access.
+
+    The value is stored in the package namespace, so later lookups are
+    plain attribute reads.
+
+    Args:
+        name: Attribute being looked up on the package
+
+    Returns:
+        The exported object
+
+    Raises:
+        AttributeError: If name is not exported
+    """
+    submodule = _EXPORTS.get(name)
+    if submodule is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{submodule}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List module attributes including not-yet-loaded exports."""
+    return sorted(set(globals()) | set(__all__))
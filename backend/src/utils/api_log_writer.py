@@ -0,0 +1,242 @@
+"""Batched background writer for APILog rows.
+
+Gemini calls are audited in the api_logs table. Writing one row per call
+with its own commit costs a database round trip per API call; this module
+queues rows in memory and inserts them in batches from a background task.
+
+api_logs is partitioned by month (migration 010); maintain_api_log_partitions
+keeps creating partitions ahead of the current month so rows never pile up in
+the default partition.
+
+Example usage:
+    from src.utils.api_log_writer import api_log_writer
+
+    # Application startup / shutdown (see lifespan in main.py)
+    partition_task = asyncio.create_task(maintain_api_log_partitions())
+    await api_log_writer.start()
+    await api_log_writer.stop()
+
+    # After each Gemini call
+    api_log_writer.enqueue(
+        {
+            "document_id": 42,
+            "operation": "summarize",
+            "tokens_input": 1200,
+            "tokens_output": 350,
+            "cost_usd": Decimal("0.000412"),
+            "latency_ms": 830,
+            "status": "success",
+        }
+    )
+"""
+
+import asyncio
+from typing import Any, Optional
+
+from sqlalchemy import insert, text
+
+from src.models import APILog, get_db_context
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Wait this long after the first queued row so more rows can join the batch
+DEFAULT_FLUSH_INTERVAL_SECONDS = 0.1
+
+# Maximum rows per INSERT
+DEFAULT_MAX_BATCH_SIZE = 200
+
+# Rows held in memory before new rows are dropped
+DEFAULT_MAX_QUEUE_SIZE = 10_000
+
+# Monthly api_logs partitions kept ahead of the current month
+PARTITION_MONTHS_AHEAD = 12
+
+# How often a running process extends the api_logs partitions
+PARTITION_MAINTENANCE_INTERVAL_SECONDS = 24 * 60 * 60
+
+# create_api_logs_partition() (migration 010) skips existing partitions
+CREATE_UPCOMING_PARTITIONS = text(
+    "SELECT create_api_logs_partition("
+    "(date_trunc('month', now()) + make_interval(months => n))::date) "
+    "FROM generate_series(0, :months_ahead) AS n"
+)
+
+
+class APILogWriter:
+    """Queue APILog rows and insert them in batches from a background task.
+
+    Rows are plain dicts of APILog column values. ``enqueue`` never blocks and
+    never touches the database; the background task waits for a row, gives
+    the batch ``flush_interval`` seconds to fill, then inserts up to
+    ``max_batch_size`` rows in one statement and one commit.
+
+    Logging is best effort: a failed batch is logged and dropped, and rows
+    are dropped (with a warning) if the queue is full.
+
+    ``enqueue`` must be called from the event loop thread.
+
+    Attributes:
+        flush_interval: Seconds to wait for a batch to fill
+        max_batch_size: Maximum rows per INSERT
+    """
+
+    def __init__(
+        self,
+        flush_interval: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+        max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+        max_queue_size: int = DEFAULT_MAX_QUEUE_SIZE,
+    ):
+        """Initialize the writer (the background task is started separately).
+
+        Args:
+            flush_interval: Seconds to wait for a batch to fill
+            max_batch_size: Maximum rows per INSERT
+            max_queue_size: Maximum queued rows before new rows are dropped
+        """
+        self.flush_interval = flush_interval
+        self.max_batch_size = max_batch_size
+        self.max_queue_size = max_queue_size
+        # Created on first use so it binds to the running event loop
+        self._queue: Optional[asyncio.Queue[dict[str, Any]]] = None
+        self._task: Optional[asyncio.Task] = None
+        # Rows taken from the queue by the task but not yet handed to a flush
+        self._pending: list[dict[str, Any]] = []
+
+    @property
+    def queue(self) -> asyncio.Queue:
+        """Queue of pending rows, created on first access."""
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        return self._queue
+
+    def enqueue(self, row: dict[str, Any]) -> None:
+        """Queue an APILog row for insertion.
+
+        Args:
+            row: APILog column values (created_at defaults on the server)
+        """
+        try:
+            self.queue.put_nowait(row)
+        except asyncio.QueueFull:
+            logger.warning(
+                "API log queue full, dropping row",
+                operation=row.get("operation"),
+                document_id=row.get("document_id"),
+            )
+
+    async def start(self) -> None:
+        """Start the background flush task (no-op if already running)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the background task and write any rows still queued."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+        pending, self._pending = self._pending, []
+        while pending or not self.queue.empty():
+            await self._flush(self._drain(pending))
+            pending = []
+
+        # A later start() may run on a different event loop
+        self._queue = None
+
+    async def _run(self) -> None:
+        """Wait for rows and flush them in batches until cancelled."""
+        while True:
+            self._pending = [await self.queue.get()]
+            await asyncio.sleep(self.flush_interval)
+            batch, self._pending = self._drain(self._pending), []
+            await self._flush(batch)
+
+    def _drain(
+        self, batch: Optional[list[dict[str, Any]]] = None
+    ) -> list[dict[str, Any]]:
+        """Take queued rows without waiting, up to max_batch_size.
+
+        Args:
+            batch: Rows already taken from the queue
+
+        Returns:
+            List of rows to insert
+        """
+        batch = batch if batch is not None else []
+        while len(batch) < self.max_batch_size:
+            try:
+                batch.append(self.queue.get_nowait())
+            except asyncio.QueueEmpty:
+                break
+        return batch
+
+    async def _flush(self, rows: list[dict[str, Any]]) -> None:
+        """Insert a batch off the event loop, logging (not raising) failures.
+
+        Args:
+            rows: APILog rows to insert
+        """
+        try:
+            await asyncio.to_thread(self._write, rows)
+        except Exception as e:
+            logger.error(
+                "Failed to write API log batch",
+                rows=len(rows),
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+
+    @staticmethod
+    def _write(rows: list[dict[str, Any]]) -> None:
+        """Insert rows with one executemany INSERT and one commit.
+
+        Args:
+            rows: APILog rows to insert
+        """
+        with get_db_context() as db:
+            db.execute(insert(APILog.__table__), rows)
+
+
+# Process-wide writer, started and stopped by the application lifespan
+api_log_writer = APILogWriter()
+
+
+def ensure_api_log_partitions(months_ahead: int = PARTITION_MONTHS_AHEAD) -> None:
+    """Create api_logs partitions from the current month to months_ahead.
+
+    Rows already in api_logs_default for a new partition's month are moved
+    into it by create_api_logs_partition().
+
+    Args:
+        months_ahead: Number of months after the current one to cover
+    """
+    with get_db_context() as db:
+        db.execute(CREATE_UPCOMING_PARTITIONS, {"months_ahead": months_ahead})
+
+
+async def maintain_api_log_partitions(
+    interval: float = PARTITION_MAINTENANCE_INTERVAL_SECONDS,
+) -> None:
+    """Extend api_logs partitions now and then every interval until cancelled.
+
+    Failures are logged and retried at the next interval; until then new rows
+    still land in api_logs_default.
+
+    Args:
+        interval: Seconds between runs
+    """
+    while True:
+        try:
+            await asyncio.to_thread(ensure_api_log_partitions)
+        except Exception as e:
+            logger.warning(
+                "Failed to create api_logs partitions",
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+        await asyncio.sleep(interval)
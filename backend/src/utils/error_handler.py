@@ -10,9 +10,11 @@ This module provides:
 import asyncio
 import functools
 import logging
+import random
 import time
+from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Callable, Optional, TypeVar
+from typing import Any, Awaitable, Callable, Iterable, Literal, Optional, TypeVar
 
 # Type variable for generic function return types
 T = TypeVar("T")
@@ -78,6 +80,16 @@ class AppError(Exception):
         is_retryable: Whether this error can be retried (default: False)
     """
 
+    # Attributes live in slots, so instances never materialize a __dict__
+    __slots__ = (
+        "error_code",
+        "message",
+        "details",
+        "status_code",
+        "is_retryable",
+        "_dict",
+    )
+
     def __init__(
         self,
         error_code: ErrorCode,
@@ -100,19 +112,25 @@ class AppError(Exception):
         self.details = details or {}
         self.status_code = status_code
         self.is_retryable = is_retryable
+        self._dict: Optional[dict[str, Any]] = None
         super().__init__(self.message)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert error to dictionary for JSON serialization.
 
+        The dictionary is built on the first call and reused afterwards, so
+        treat it as read-only.
+
         Returns:
             Dictionary with error_code, message, and details
         """
-        return {
-            "error_code": self.error_code.value,
-            "message": self.message,
-            "details": self.details,
-        }
+        if self._dict is None:
+            self._dict = {
+                "error_code": self.error_code.value,
+                "message": self.message,
+                "details": self.details,
+            }
+        return self._dict
 
     def __str__(self) -> str:
         """String representation of the error."""
@@ -128,14 +146,155 @@ class AppError(Exception):
         )
 
 
+# Error codes retried by retry_with_backoff when none are given
+DEFAULT_RETRYABLE_ERROR_CODES: frozenset[ErrorCode] = frozenset(
+    {
+        ErrorCode.RATE_LIMITED,
+        ErrorCode.TIMEOUT,
+        ErrorCode.API_ERROR,
+        ErrorCode.DB_CONNECTION_ERROR,
+    }
+)
+
+# Time reserved before a retry deadline for the retried call itself
+DEADLINE_SLACK_SECONDS = 0.05
+
+
+@dataclass(frozen=True, slots=True)
+class _RetryPolicy:
+    """Configuration of one retry_with_backoff decorator, resolved once.
+
+    Shared by every function the decorator is applied to; both wrappers
+    delegate the per-failure decision to ``plan``.
+    """
+
+    max_retries: int
+    initial_delay: float
+    max_delay: float
+    exponential_base: float
+    exceptions: tuple[type[Exception], ...]
+    retryable_error_codes: frozenset[ErrorCode]
+    on_retry: Optional[Callable[[Exception, int, float], None]]
+    jitter: str
+    uniform: Callable[[float, float], float]
+    timeout: Optional[float]
+
+    def deadline(self) -> Optional[float]:
+        """Return the time.monotonic() deadline for a call starting now.
+
+        Returns:
+            Absolute deadline, or None when the policy has no timeout
+        """
+        if self.timeout is None:
+            return None
+        return time.monotonic() + self.timeout
+
+    def plan(
+        self,
+        e: Exception,
+        attempt: int,
+        prev_delay: float,
+        deadline: Optional[float],
+        logger: logging.Logger,
+        func_name: str,
+    ) -> tuple[bool, float]:
+        """Decide whether to retry after a failed attempt.
+
+        Classifies the error, computes the next delay, logs, and invokes
+        on_retry.
+
+        Args:
+            e: Exception raised by the attempt
+            attempt: Zero-based attempt number
+            prev_delay: Delay before this attempt (initial_delay at first)
+            deadline: time.monotonic() deadline of the current call, or None
+            logger: Logger of the decorated function's module
+            func_name: Name of the decorated function (for log context)
+
+        Returns:
+            Tuple of (should_retry, delay in seconds)
+        """
+        # Check if this is a retryable error
+        is_retryable = True
+        if isinstance(e, AppError):
+            is_retryable = e.is_retryable or e.error_code in self.retryable_error_codes
+
+        # Time left before the deadline, keeping slack for the next attempt
+        remaining = (
+            None
+            if deadline is None
+            else deadline - time.monotonic() - DEADLINE_SLACK_SECONDS
+        )
+
+        # If not retryable, out of retries or out of time, the caller re-raises
+        if (
+            not is_retryable
+            or attempt >= self.max_retries
+            or (remaining is not None and remaining <= 0)
+        ):
+            if logger.isEnabledFor(logging.ERROR):
+                logger.error(
+                    "Operation failed after %d attempts: %s",
+                    attempt + 1,
+                    e,
+                    extra={
+                        "function": func_name,
+                        "attempt": attempt + 1,
+                        "error_type": type(e).__name__,
+                    },
+                )
+            return False, prev_delay
+
+        # Calculate delay with exponential backoff and jitter
+        if self.jitter == "decorrelated":
+            delay = min(
+                self.max_delay, self.uniform(self.initial_delay, prev_delay * 3)
+            )
+        else:
+            delay = min(
+                self.initial_delay * (self.exponential_base**attempt), self.max_delay
+            )
+            if self.jitter == "full":
+                delay = self.uniform(0, delay)
+
+        # Never sleep past the deadline
+        if remaining is not None and delay > remaining:
+            delay = remaining
+
+        # Log retry attempt
+        if logger.isEnabledFor(logging.WARNING):
+            logger.warning(
+                "Retry attempt %d/%d after %.2fs: %s",
+                attempt + 1,
+                self.max_retries,
+                delay,
+                e,
+                extra={
+                    "function": func_name,
+                    "attempt": attempt + 1,
+                    "delay": delay,
+                    "error_type": type(e).__name__,
+                },
+            )
+
+        # Call optional retry callback
+        if self.on_retry:
+            self.on_retry(e, attempt + 1, delay)
+
+        return True, delay
+
+
 def retry_with_backoff(
     max_retries: int = 3,
     initial_delay: float = 1.0,
     max_delay: float = 60.0,
     exponential_base: float = 2.0,
     exceptions: tuple[type[Exception], ...] = (Exception,),
-    retryable_error_codes: Optional[set[ErrorCode]] = None,
+    retryable_error_codes: Optional[Iterable[ErrorCode]] = None,
     on_retry: Optional[Callable[[Exception, int, float], None]] = None,
+    jitter: Literal["none", "full", "decorrelated"] = "full",
+    rng: Optional[random.Random] = None,
+    timeout: Optional[float] = None,
 ) -> Callable[[Callable[..., T]], Callable[..., T]]:
     """Decorator for automatic retry with exponential backoff.
 
@@ -143,6 +302,9 @@ def retry_with_backoff(
     synchronous and asynchronous functions. It supports:
     - Configurable retry attempts and delays
     - Exponential backoff with maximum delay cap
+    - Randomized (jittered) delays so concurrent callers don't retry in lockstep
+    - An optional per-call time budget that caps delays and stops hopeless
+      retries
     - Selective retry based on exception types or error codes
     - Optional callback on retry attempts
     - Structured logging integration
@@ -153,12 +315,26 @@ def retry_with_backoff(
         max_delay: Maximum delay between retries (default: 60.0)
         exponential_base: Base for exponential backoff (default: 2.0)
         exceptions: Tuple of exception types to catch (default: all Exception)
-        retryable_error_codes: Set of ErrorCode values to retry (AppError only)
+        retryable_error_codes: ErrorCode values to retry (AppError only;
+            default: DEFAULT_RETRYABLE_ERROR_CODES)
         on_retry: Optional callback function called on each retry attempt
+        jitter: Delay randomization (default: "full"):
+            - "none": the plain exponential delay
+            - "full": uniform between 0 and the exponential delay
+            - "decorrelated": uniform between initial_delay and 3x the
+              previous delay, capped at max_delay
+        rng: Random number generator for jitter (default: the random module);
+            pass a seeded random.Random for reproducible delays
+        timeout: Time budget in seconds for each call, retries included; no
+            retry is started once it is spent and delays are shortened to end
+            before it (default: None, no budget)
 
     Returns:
         Decorated function with retry logic
 
+    Raises:
+        ValueError: If jitter is not one of the supported modes
+
     Example:
         >>> @retry_with_backoff(max_retries=3, initial_delay=1.0)
         ... def api_call():
@@ -173,139 +349,88 @@ def retry_with_backoff(
         ...     # Make Gemini API request
         ...     pass
     """
-    # Default retryable error codes if not specified
-    if retryable_error_codes is None:
-        retryable_error_codes = {
-            ErrorCode.RATE_LIMITED,
-            ErrorCode.TIMEOUT,
-            ErrorCode.API_ERROR,
-            ErrorCode.DB_CONNECTION_ERROR,
-        }
+    if jitter not in ("none", "full", "decorrelated"):
+        raise ValueError(f"Unsupported jitter mode: {jitter!r}")
+
+    policy = _RetryPolicy(
+        max_retries=max_retries,
+        initial_delay=initial_delay,
+        max_delay=max_delay,
+        exponential_base=exponential_base,
+        exceptions=exceptions,
+        # Default retryable error codes if not specified
+        retryable_error_codes=(
+            DEFAULT_RETRYABLE_ERROR_CODES
+            if retryable_error_codes is None
+            else frozenset(retryable_error_codes)
+        ),
+        on_retry=on_retry,
+        jitter=jitter,
+        uniform=(rng or random).uniform,
+        timeout=timeout,
+    )
 
     def decorator(func: Callable[..., T]) -> Callable[..., T]:
         """Decorator wrapper."""
+        # Resolved once per decorated function, not on every call
+        logger = logging.getLogger(func.__module__)
+        func_name = func.__name__
 
-        @functools.wraps(func)
-        async def async_wrapper(*args: Any, **kwargs: Any) -> T:
-            """Async function wrapper with retry logic."""
-            logger = logging.getLogger(func.__module__)
-            last_exception: Optional[Exception] = None
-
-            for attempt in range(max_retries + 1):
-                try:
-                    return await func(*args, **kwargs)
-                except exceptions as e:
-                    last_exception = e
-
-                    # Check if this is a retryable error
-                    is_retryable = True
-                    if isinstance(e, AppError):
-                        is_retryable = (
-                            e.is_retryable or e.error_code in retryable_error_codes
-                        )
+        # Only the wrapper matching the function type is created
+        if asyncio.iscoroutinefunction(func):
 
-                    # If not retryable or out of retries, raise immediately
-                    if not is_retryable or attempt >= max_retries:
-                        logger.error(
-                            f"Operation failed after {attempt + 1} attempts: {e}",
-                            extra={
-                                "function": func.__name__,
-                                "attempt": attempt + 1,
-                                "error_type": type(e).__name__,
-                            },
+            @functools.wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> T:
+                """Async function wrapper with retry logic."""
+                deadline = policy.deadline()
+                delay = policy.initial_delay
+                for attempt in range(policy.max_retries + 1):
+                    try:
+                        return await func(*args, **kwargs)
+                    except policy.exceptions as e:
+                        should_retry, delay = policy.plan(
+                            e, attempt, delay, deadline, logger, func_name
                         )
-                        raise
-
-                    # Calculate delay with exponential backoff
-                    delay = min(initial_delay * (exponential_base**attempt), max_delay)
-
-                    # Log retry attempt
-                    logger.warning(
-                        f"Retry attempt {attempt + 1}/{max_retries} after {delay:.2f}s: {e}",
-                        extra={
-                            "function": func.__name__,
-                            "attempt": attempt + 1,
-                            "delay": delay,
-                            "error_type": type(e).__name__,
-                        },
-                    )
-
-                    # Call optional retry callback
-                    if on_retry:
-                        on_retry(e, attempt + 1, delay)
-
-                    # Wait before retry
+                        if not should_retry:
+                            raise
                     await asyncio.sleep(delay)
+                raise RuntimeError("Unexpected retry loop exit")
 
-            # This should never be reached, but satisfy type checker
-            if last_exception:
-                raise last_exception
-            raise RuntimeError("Unexpected retry loop exit")
+            return async_wrapper  # type: ignore
 
         @functools.wraps(func)
         def sync_wrapper(*args: Any, **kwargs: Any) -> T:
             """Synchronous function wrapper with retry logic."""
-            logger = logging.getLogger(func.__module__)
-            last_exception: Optional[Exception] = None
-
-            for attempt in range(max_retries + 1):
+            deadline = policy.deadline()
+            delay = policy.initial_delay
+            for attempt in range(policy.max_retries + 1):
                 try:
                     return func(*args, **kwargs)
-                except exceptions as e:
-                    last_exception = e
-
-                    # Check if this is a retryable error
-                    is_retryable = True
-                    if isinstance(e, AppError):
-                        is_retryable = (
-                            e.is_retryable or e.error_code in retryable_error_codes
-                        )
-
-                    # If not retryable or out of retries, raise immediately
-                    if not is_retryable or attempt >= max_retries:
-                        logger.error(
-                            f"Operation failed after {attempt + 1} attempts: {e}",
-                            extra={
-                                "function": func.__name__,
-                                "attempt": attempt + 1,
-                                "error_type": type(e).__name__,
-                            },
-                        )
+                except policy.exceptions as e:
+                    should_retry, delay = policy.plan(
+                        e, attempt, delay, deadline, logger, func_name
+                    )
+                    if not should_retry:
                         raise
+                time.sleep(delay)
+            raise RuntimeError("Unexpected retry loop exit")
 
-                    # Calculate delay with exponential backoff
-                    delay = min(initial_delay * (exponential_base**attempt), max_delay)
-
-                    # Log retry attempt
-                    logger.warning(
-                        f"Retry attempt {attempt + 1}/{max_retries} after {delay:.2f}s: {e}",
-                        extra={
-                            "function": func.__name__,
-                            "attempt": attempt + 1,
-                            "delay": delay,
-                            "error_type": type(e).__name__,
-                        },
-                    )
+        return sync_wrapper
 
-                    # Call optional retry callback
-                    if on_retry:
-                        on_retry(e, attempt + 1, delay)
+    return decorator
 
-                    # Wait before retry
-                    time.sleep(delay)
 
-            # This should never be reached, but satisfy type checker
-            if last_exception:
-                raise last_exception
-            raise RuntimeError("Unexpected retry loop exit")
+@functools.lru_cache(maxsize=256)
+def _logger_for(module: str) -> logging.Logger:
+    """Return the stdlib logger for a module, cached per module name.
 
-        # Return appropriate wrapper based on function type
-        if asyncio.iscoroutinefunction(func):
-            return async_wrapper  # type: ignore
-        else:
-            return sync_wrapper  # type: ignore
+    Args:
+        module: Module name (usually ``func.__module__``)
 
-    return decorator
+    Returns:
+        Logger instance
+    """
+    return logging.getLogger(module)
 
 
 # Graceful degradation strategies
@@ -334,6 +459,7 @@ class GracefulDegradation:
         Returns:
             Function result or fallback value
         """
+        logger = _logger_for(func.__module__)
 
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> T:
@@ -341,54 +467,72 @@ class GracefulDegradation:
                 return func(*args, **kwargs)
             except exceptions as e:
                 if log_errors:
-                    logger = logging.getLogger(func.__module__)
-                    logger.warning(
-                        f"Function {func.__name__} failed, using fallback: {e}",
-                        extra={
-                            "function": func.__name__,
-                            "error_type": type(e).__name__,
-                            "fallback_value": str(fallback_value),
-                        },
-                    )
+                    _log_fallback(logger, func, e, fallback_value)
                 return fallback_value
 
         return wrapper
 
     @staticmethod
     async def with_fallback_async(
-        func: Callable[..., T],
+        func: Callable[..., Awaitable[T]],
+        *args: Any,
         fallback_value: T,
         exceptions: tuple[type[Exception], ...] = (Exception,),
         log_errors: bool = True,
+        logger: Optional[logging.Logger] = None,
+        **kwargs: Any,
     ) -> T:
-        """Execute async function with fallback value on error.
+        """Await ``func(*args, **kwargs)``, returning a fallback value on error.
 
         Args:
             func: Async function to execute
+            *args: Positional arguments for func
             fallback_value: Value to return on error
             exceptions: Tuple of exceptions to catch
             log_errors: Whether to log errors (default: True)
+            logger: Logger for failures (default: func's module logger)
+            **kwargs: Keyword arguments for func
 
         Returns:
             Function result or fallback value
         """
         try:
-            return await func()
+            return await func(*args, **kwargs)
         except exceptions as e:
             if log_errors:
-                logger = logging.getLogger(func.__module__)
-                logger.warning(
-                    f"Function {func.__name__} failed, using fallback: {e}",
-                    extra={
-                        "function": func.__name__,
-                        "error_type": type(e).__name__,
-                        "fallback_value": str(fallback_value),
-                    },
+                _log_fallback(
+                    logger or _logger_for(func.__module__), func, e, fallback_value
                 )
             return fallback_value
 
 
-# HTTP status code mappings for common errors
+def _log_fallback(
+    logger: logging.Logger, func: Callable[..., Any], e: Exception, fallback_value: Any
+) -> None:
+    """Log that a function failed and its fallback value is being used.
+
+    Args:
+        logger: Logger to write to
+        func: Function that failed
+        e: Exception raised by func
+        fallback_value: Value returned instead
+    """
+    if logger.isEnabledFor(logging.WARNING):
+        logger.warning(
+            "Function %s failed, using fallback: %s",
+            func.__name__,
+            e,
+            extra={
+                "function": func.__name__,
+                "error_type": type(e).__name__,
+                "fallback_value": str(fallback_value),
+            },
+        )
+
+
+# HTTP status code mappings for common errors. ErrorCode members hash as
+# plain strings, so a lookup is a single C-level dict probe; keep every
+# ErrorCode mapped so get_status_code never needs its 500 fallback.
 ERROR_STATUS_CODES: dict[ErrorCode, int] = {
     # 400 Bad Request
     ErrorCode.INVALID_PDF: 400,
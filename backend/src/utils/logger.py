@@ -12,47 +12,152 @@ Example usage:
     logger.error("Failed to parse PDF", error="Invalid format", request_id="abc-123")
 """
 
+import atexit
+import functools
 import logging
 import os
+import queue
 import sys
+import time
+from logging.handlers import QueueHandler, QueueListener
 from typing import Any, Optional
 
+import orjson
 import structlog
 from structlog.types import EventDict, Processor
 
+# Buffered log lines are flushed to the stream at least this often while
+# records keep arriving (ERROR and above are flushed immediately)
+LOG_FLUSH_INTERVAL_SECONDS = 1.0
 
-def add_module_name(logger: Any, method_name: str, event_dict: EventDict) -> EventDict:
-    """Add module name to log event.
 
-    Args:
-        logger: The logger instance
-        method_name: Name of the logging method (info, error, etc.)
-        event_dict: The event dictionary to modify
+class BufferedStreamHandler(logging.StreamHandler):
+    """StreamHandler that flushes on an interval instead of after every record.
+
+    logging.StreamHandler flushes after each record, which is one write
+    syscall per log line. This handler leaves lines in the stream's buffer
+    and flushes when ``flush_interval`` has passed since the last flush or a
+    record at ERROR or above is emitted. Remaining lines are flushed by
+    ``logging.shutdown`` at interpreter exit.
+
+    Attributes:
+        flush_interval: Maximum seconds between flushes while logging
+    """
+
+    def __init__(
+        self,
+        stream: Optional[Any] = None,
+        flush_interval: float = LOG_FLUSH_INTERVAL_SECONDS,
+    ):
+        """Initialize the handler.
+
+        Args:
+            stream: Text stream to write to (defaults to sys.stderr)
+            flush_interval: Maximum seconds between flushes while logging
+        """
+        super().__init__(stream)
+        self.flush_interval = flush_interval
+        self._next_flush = 0.0
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write a record, flushing only when due.
+
+        Args:
+            record: Log record to write
+        """
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+            now = time.monotonic()
+            if record.levelno >= logging.ERROR or now >= self._next_flush:
+                self.flush()
+                self._next_flush = now + self.flush_interval
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class _FlushingQueueListener(QueueListener):
+    """QueueListener that flushes its handlers whenever the queue runs dry.
+
+    Under load records are written in batches and flushed by
+    BufferedStreamHandler's interval; when logging goes quiet the last
+    lines are flushed before the thread blocks, so they are not held back.
+    """
+
+    def dequeue(self, block: bool) -> logging.LogRecord:
+        """Flush pending output before blocking on an empty queue.
+
+        Args:
+            block: Whether to block until a record is available
+
+        Returns:
+            Next record (or the stop sentinel)
+        """
+        if block and self.queue.empty():
+            for handler in self.handlers:
+                handler.flush()
+        return self.queue.get(block)
+
+
+# Level names accepted by setup_logging, resolved once
+_LOG_LEVELS = logging.getLevelNamesMapping()
+
+# (level, format) applied by the last setup_logging call, None until then
+_configured: Optional[tuple[int, str]] = None
+
+# Background thread writing log records to stdout (set by setup_logging)
+_log_listener: Optional[QueueListener] = None
+
+
+def _start_log_listener() -> logging.Handler:
+    """Start the background log writer thread.
 
     Returns:
-        Modified event dictionary with module name
+        QueueHandler that hands records to the writer thread
     """
-    record = event_dict.get("_record")
-    if record:
-        event_dict["module"] = record.name
-    return event_dict
+    global _log_listener
+    _stop_log_listener()
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _log_listener = _FlushingQueueListener(log_queue, BufferedStreamHandler(sys.stdout))
+    _log_listener.start()
+    return QueueHandler(log_queue)
+
+
+def _stop_log_listener() -> None:
+    """Stop the background log writer after writing out queued records."""
+    global _log_listener
+    if _log_listener is not None:
+        _log_listener.stop()
+        for handler in _log_listener.handlers:
+            handler.flush()
+        _log_listener = None
+
+
+# Registered after logging's own shutdown hook, so it runs first at exit
+atexit.register(_stop_log_listener)
+
 
+# ISO 8601 UTC timestamp processor, built once and shared by every event
+add_timestamp = structlog.processors.TimeStamper(fmt="iso")
 
-def add_timestamp(logger: Any, method_name: str, event_dict: EventDict) -> EventDict:
-    """Add ISO 8601 timestamp to log event.
+
+def _orjson_dumps(event_dict: EventDict, **kwargs: Any) -> str:
+    """Serialize an event dict with orjson for JSONRenderer.
+
+    The stdlib logger factory expects ``str`` messages, so the bytes from
+    orjson are decoded here rather than written to a bytes logger.
 
     Args:
-        logger: The logger instance
-        method_name: Name of the logging method
-        event_dict: The event dictionary to modify
+        event_dict: The event dictionary to render
+        **kwargs: JSONRenderer dumps keywords (only ``default`` is used)
 
     Returns:
-        Modified event dictionary with timestamp
+        JSON string for the event
     """
-    event_dict["timestamp"] = structlog.processors.TimeStamper(fmt="iso")(
-        logger, method_name, event_dict
-    )["timestamp"]
-    return event_dict
+    return orjson.dumps(
+        event_dict, default=kwargs.get("default"), option=orjson.OPT_NON_STR_KEYS
+    ).decode()
 
 
 def setup_logging(
@@ -77,20 +182,32 @@ def setup_logging(
     log_format = log_format or os.getenv("LOG_FORMAT", "json")
 
     # Convert string log level to logging constant
-    numeric_level = getattr(logging, log_level.upper(), logging.INFO)
-
-    # Configure standard library logging
-    logging.basicConfig(
-        format="%(message)s",
-        stream=sys.stdout,
-        level=numeric_level,
-    )
-
-    # Build processor pipeline
+    numeric_level = _LOG_LEVELS.get(log_level.upper(), logging.INFO)
+
+    # Repeat calls with the same settings (e.g. __main__ and create_app in
+    # one process) keep the existing configuration and cached loggers
+    global _configured
+    key = (numeric_level, log_format.lower())
+    if _configured == key:
+        return
+
+    # Configure standard library logging. Callers only pay for putting the
+    # rendered record on a queue; a background thread writes it to stdout.
+    # Like basicConfig, this is skipped if the root logger has handlers.
+    if not logging.getLogger().handlers:
+        logging.basicConfig(
+            format="%(message)s",
+            handlers=[_start_log_listener()],
+            level=numeric_level,
+        )
+
+    # Build processor pipeline. filter_by_level comes first so events dropped
+    # by a stdlib logger level (e.g. a noisy module raised to WARNING) stop
+    # before any context merging, timestamping or rendering.
     processors: list[Processor] = [
+        structlog.stdlib.filter_by_level,
         structlog.contextvars.merge_contextvars,
         structlog.stdlib.add_log_level,
-        add_module_name,
         add_timestamp,
         structlog.processors.StackInfoRenderer(),
         structlog.processors.format_exc_info,
@@ -98,35 +215,46 @@ def setup_logging(
 
     # Add appropriate renderer based on format
     if log_format.lower() == "json":
-        processors.append(structlog.processors.JSONRenderer())
+        processors.append(structlog.processors.JSONRenderer(_orjson_dumps))
     else:
         # Console format for development
         processors.append(structlog.dev.ConsoleRenderer(colors=sys.stdout.isatty()))
 
-    # Configure structlog
+    # Configure structlog. The filtering wrapper turns calls below the
+    # configured level into no-ops before any event dict or processor work.
     structlog.configure(
         processors=processors,
-        wrapper_class=structlog.stdlib.BoundLogger,
+        wrapper_class=structlog.make_filtering_bound_logger(numeric_level),
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
     )
 
+    # Loggers handed out earlier may have cached the previous configuration
+    get_logger.cache_clear()
+    _configured = key
+
 
-def get_logger(name: str) -> structlog.stdlib.BoundLogger:
+@functools.lru_cache(maxsize=None)
+def get_logger(name: str) -> structlog.typing.FilteringBoundLogger:
     """Get a structured logger instance.
 
+    Loggers are cached per name, so repeated calls with the same ``__name__``
+    return the same object. The cache is cleared by setup_logging. Every
+    event from the returned logger includes ``module=name``.
+
     Args:
         name: Name for the logger, typically __name__ of the module
 
     Returns:
-        A configured structlog BoundLogger instance
+        A configured structlog FilteringBoundLogger instance
 
     Example:
         logger = get_logger(__name__)
         logger.info("Starting process", process_id=123)
     """
-    return structlog.get_logger(name)
+    # Bound as an initial value so it is set once, not by a processor per event
+    return structlog.get_logger(name, module=name)
 
 
 def bind_context(
@@ -150,17 +278,16 @@ def bind_context(
         bind_context(request_id="abc-123", user_id=456, document_id=789)
         logger.info("Processing started")  # Will include all context
     """
-    context = {}
+    # kwargs is already a fresh dict, so add the named fields to it directly
     if request_id is not None:
-        context["request_id"] = request_id
+        kwargs["request_id"] = request_id
     if user_id is not None:
-        context["user_id"] = user_id
+        kwargs["user_id"] = user_id
     if document_id is not None:
-        context["document_id"] = document_id
-    context.update(kwargs)
+        kwargs["document_id"] = document_id
 
-    if context:
-        structlog.contextvars.bind_contextvars(**context)
+    if kwargs:
+        structlog.contextvars.bind_contextvars(**kwargs)
 
 
 def clear_context() -> None:
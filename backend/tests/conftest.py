@@ -34,19 +34,48 @@ def sample_retry_config():
 
 
 @pytest.fixture(autouse=True)
+def no_env_file(monkeypatch):
+    """Stop Settings() from looking for a .env file during tests.
+
+    Tests provide configuration through os.environ only, so a developer's
+    local .env can neither leak in nor cost a file lookup per Settings().
+    """
+    from src.config import Settings
+
+    monkeypatch.setitem(Settings.model_config, "env_file", None)
+
+
+@pytest.fixture(autouse=True)
+def clear_log_context():
+    """Clear bound structlog context variables after each test."""
+    yield
+    import structlog
+
+    structlog.contextvars.clear_contextvars()
+
+
+@pytest.fixture
 def reset_logging():
-    """Reset logging configuration between tests to avoid state leakage."""
+    """Reset logging configuration after a test that reconfigures it.
+
+    Opt in per module with ``pytestmark = pytest.mark.usefixtures(
+    "reset_logging")`` where tests call setup_logging or build the app.
+    """
     yield
     # Cleanup happens after each test
     import logging
     import structlog
 
-    # Clear structlog context
-    structlog.contextvars.clear_contextvars()
-
     # Reset structlog configuration
     structlog.reset_defaults()
 
+    # Drop loggers cached by get_logger under the old configuration and let
+    # the next setup_logging call configure from scratch
+    from src.utils import logger as logger_module
+
+    logger_module.get_logger.cache_clear()
+    logger_module._configured = None
+
     # Clear all handlers from root logger
     root = logging.getLogger()
     for handler in root.handlers[:]:
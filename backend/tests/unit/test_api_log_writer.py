@@ -0,0 +1,128 @@
+"""Unit tests for the batched APILog writer."""
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+from src.utils import api_log_writer as api_log_writer_module
+from src.utils.api_log_writer import (
+    CREATE_UPCOMING_PARTITIONS,
+    APILogWriter,
+    ensure_api_log_partitions,
+    maintain_api_log_partitions,
+)
+
+
+def make_row(i: int) -> dict:
+    """Build a minimal APILog row for tests."""
+    return {
+        "operation": "summarize",
+        "tokens_input": i,
+        "tokens_output": 0,
+        "cost_usd": 0,
+        "latency_ms": 1,
+        "status": "success",
+    }
+
+
+class TestAPILogWriter:
+    """Test suite for APILogWriter batching."""
+
+    async def test_rows_written_in_one_batch(self):
+        """Test that rows queued together are inserted in a single batch."""
+        writer = APILogWriter(flush_interval=0.01)
+        batches = []
+
+        with patch.object(APILogWriter, "_write", side_effect=batches.append):
+            await writer.start()
+            for i in range(5):
+                writer.enqueue(make_row(i))
+            await asyncio.sleep(0.05)
+            await writer.stop()
+
+        assert len(batches) == 1
+        assert [row["tokens_input"] for row in batches[0]] == [0, 1, 2, 3, 4]
+
+    async def test_batches_capped_at_max_size(self):
+        """Test that a batch never exceeds max_batch_size rows."""
+        writer = APILogWriter(flush_interval=0.01, max_batch_size=2)
+        batches = []
+
+        with patch.object(APILogWriter, "_write", side_effect=batches.append):
+            await writer.start()
+            for i in range(5):
+                writer.enqueue(make_row(i))
+            await asyncio.sleep(0.1)
+            await writer.stop()
+
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+
+    async def test_stop_flushes_pending_rows(self):
+        """Test that rows still waiting for the flush interval are written."""
+        writer = APILogWriter(flush_interval=60)
+        batches = []
+
+        with patch.object(APILogWriter, "_write", side_effect=batches.append):
+            await writer.start()
+            writer.enqueue(make_row(1))
+            writer.enqueue(make_row(2))
+            await asyncio.sleep(0)
+            await writer.stop()
+
+        assert sum(len(batch) for batch in batches) == 2
+
+    async def test_full_queue_drops_rows(self):
+        """Test that enqueue drops rows instead of blocking when full."""
+        writer = APILogWriter(max_queue_size=1)
+
+        writer.enqueue(make_row(1))
+        writer.enqueue(make_row(2))
+
+        assert writer.queue.qsize() == 1
+
+    async def test_write_failure_is_logged_not_raised(self):
+        """Test that a failed batch does not stop the writer."""
+        writer = APILogWriter(flush_interval=0)
+
+        with patch.object(APILogWriter, "_write", side_effect=RuntimeError("db")):
+            await writer.start()
+            writer.enqueue(make_row(1))
+            await asyncio.sleep(0.05)
+            assert not writer._task.done()
+            await writer.stop()
+
+
+class TestPartitionMaintenance:
+    """Test suite for api_logs partition maintenance."""
+
+    def test_ensure_creates_upcoming_partitions(self):
+        """Test that one statement covers the current month to months_ahead."""
+        db = MagicMock()
+
+        with patch.object(api_log_writer_module, "get_db_context") as context:
+            context.return_value.__enter__.return_value = db
+            ensure_api_log_partitions(months_ahead=3)
+
+        db.execute.assert_called_once_with(
+            CREATE_UPCOMING_PARTITIONS, {"months_ahead": 3}
+        )
+
+    async def test_maintenance_retries_after_failure(self):
+        """Test that a failed run is logged and the task keeps running."""
+        calls = []
+
+        def fail_first_run():
+            calls.append(None)
+            if len(calls) == 1:
+                raise RuntimeError("db")
+
+        with patch.object(
+            api_log_writer_module,
+            "ensure_api_log_partitions",
+            side_effect=fail_first_run,
+        ):
+            task = asyncio.create_task(maintain_api_log_partitions(interval=0.01))
+            await asyncio.sleep(0.05)
+            assert not task.done()
+            task.cancel()
+
+        assert len(calls) >= 2
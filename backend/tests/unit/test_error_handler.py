@@ -2,12 +2,15 @@
 
 import asyncio
 import logging
+import random
 import time
 from typing import Any
+from unittest.mock import MagicMock
 
 import pytest
 
 from src.utils.error_handler import (
+    ERROR_STATUS_CODES,
     AppError,
     ErrorCode,
     GracefulDegradation,
@@ -95,6 +98,18 @@ class TestAppError:
             "details": {"size": 150000000, "limit": 100000000},
         }
 
+    def test_app_error_to_dict_is_built_once(self):
+        """Test that repeated serialization reuses the same dictionary."""
+        error = AppError(error_code=ErrorCode.DB_ERROR, message="Database error")
+
+        assert error.to_dict() is error.to_dict()
+
+    def test_app_error_uses_slots(self):
+        """Test that AppError attributes do not populate an instance __dict__."""
+        error = AppError(error_code=ErrorCode.DB_ERROR, message="Database error")
+
+        assert vars(error) == {}
+
     def test_app_error_str_representation(self):
         """Test AppError string representation."""
         error = AppError(
@@ -272,7 +287,9 @@ class TestRetryWithBackoff:
         """Test that retry delays follow exponential backoff."""
         call_times = []
 
-        @retry_with_backoff(max_retries=3, initial_delay=0.1, exponential_base=2.0)
+        @retry_with_backoff(
+            max_retries=3, initial_delay=0.1, exponential_base=2.0, jitter="none"
+        )
         def timed_failures():
             call_times.append(time.time())
             if len(call_times) < 4:
@@ -317,6 +334,102 @@ class TestRetryWithBackoff:
         for delay in delays[1:]:  # Skip first delay
             assert delay <= 2.1  # Allow small tolerance
 
+    def test_retry_full_jitter(self):
+        """Test that full jitter draws each delay from [0, exponential delay]."""
+        delays = []
+
+        @retry_with_backoff(
+            max_retries=3,
+            initial_delay=0.01,
+            on_retry=lambda e, attempt, delay: delays.append(delay),
+            rng=random.Random(42),
+        )
+        def always_fails():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            always_fails()
+
+        expected_rng = random.Random(42)
+        assert delays == [expected_rng.uniform(0, 0.01 * 2**i) for i in range(3)]
+
+    def test_retry_decorrelated_jitter(self):
+        """Test that decorrelated jitter stays within [initial_delay, max_delay]."""
+        delays = []
+
+        @retry_with_backoff(
+            max_retries=5,
+            initial_delay=0.001,
+            max_delay=0.005,
+            on_retry=lambda e, attempt, delay: delays.append(delay),
+            jitter="decorrelated",
+            rng=random.Random(0),
+        )
+        def always_fails():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            always_fails()
+
+        assert len(delays) == 5
+        assert all(0.001 <= delay <= 0.005 for delay in delays)
+
+    def test_retry_stops_when_timeout_is_spent(self):
+        """Test that no retry starts once the call's timeout is spent."""
+        call_count = 0
+
+        @retry_with_backoff(max_retries=3, timeout=0)
+        def always_fails():
+            nonlocal call_count
+            call_count += 1
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError):
+            always_fails()
+
+        assert call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_retry_delay_is_capped_by_timeout(self):
+        """Test that backoff delays are shortened to end within the timeout."""
+        delays = []
+
+        @retry_with_backoff(
+            max_retries=1,
+            initial_delay=10.0,
+            jitter="none",
+            on_retry=lambda e, attempt, delay: delays.append(delay),
+            timeout=0.2,
+        )
+        async def fails_once():
+            if not delays:
+                raise ValueError("boom")
+            return "success"
+
+        assert await fails_once() == "success"
+        assert 0 < delays[0] <= 0.2
+
+    def test_retry_timeout_starts_with_each_call(self):
+        """Test that the timeout is measured from each call, not decoration."""
+        call_count = 0
+
+        @retry_with_backoff(max_retries=1, initial_delay=0.001, timeout=0.2)
+        def fails_once():
+            nonlocal call_count
+            call_count += 1
+            if call_count % 2:
+                raise ValueError("boom")
+            return "success"
+
+        time.sleep(0.25)
+        assert fails_once() == "success"
+        assert call_count == 2
+
+    def test_retry_rejects_unknown_jitter(self):
+        """Test that an unsupported jitter mode fails at decoration time."""
+        with pytest.raises(ValueError, match="jitter"):
+            retry_with_backoff(jitter="sometimes")
+
     def test_retry_with_custom_exceptions(self):
         """Test retry with custom exception types."""
         call_count = 0
@@ -452,6 +565,33 @@ class TestGracefulDegradation:
         )
         assert result == "fallback"
 
+    @pytest.mark.asyncio
+    async def test_with_fallback_async_passes_arguments(self):
+        """Test that arguments are forwarded to the coroutine function."""
+
+        async def add(a, b, scale=1):
+            return (a + b) * scale
+
+        result = await GracefulDegradation.with_fallback_async(
+            add, 1, 2, fallback_value=0, scale=10
+        )
+        assert result == 30
+
+    @pytest.mark.asyncio
+    async def test_with_fallback_async_uses_given_logger(self):
+        """Test that failures are logged to the logger passed in."""
+        logger = MagicMock()
+
+        async def failing_async():
+            raise ValueError("Error")
+
+        result = await GracefulDegradation.with_fallback_async(
+            failing_async, fallback_value="fallback", logger=logger
+        )
+
+        assert result == "fallback"
+        logger.warning.assert_called_once()
+
 
 class TestGetStatusCode:
     """Test HTTP status code mapping."""
@@ -496,6 +636,10 @@ class TestGetStatusCode:
         """Test 401 Unauthorized status codes."""
         assert get_status_code(ErrorCode.AUTH_ERROR) == 401
 
+    def test_every_error_code_has_a_status_code(self):
+        """Test that the mapping is total, so no lookup falls back to 500."""
+        assert set(ERROR_STATUS_CODES) == set(ErrorCode)
+
 
 class TestErrorHandlerIntegration:
     """Integration tests for error handling framework."""
@@ -0,0 +1,189 @@
+"""Unit tests for error handling middleware."""
+
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import orjson
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+from sqlalchemy.exc import IntegrityError
+from starlette.exceptions import HTTPException as StarletteHTTPException
+
+from src.middleware.error_middleware import _build_error_body, setup_error_handlers
+from src.utils.error_handler import AppError, ErrorCode
+
+
+@pytest.fixture
+def client():
+    """Create a test client for an app with only the error handlers installed.
+
+    Returns:
+        TestClient that returns 500 responses instead of raising
+    """
+    app = FastAPI()
+    setup_error_handlers(app, MagicMock(debug=False))
+
+    @app.get("/app-error")
+    async def raise_app_error():
+        raise AppError(
+            ErrorCode.INVALID_PDF,
+            "Bad PDF",
+            details={"page": 3, 7: "int key", "size": Decimal("1.5")},
+            status_code=400,
+        )
+
+    @app.get("/http-error/{code}")
+    async def raise_http_error(code: int):
+        raise StarletteHTTPException(status_code=code, detail="boom")
+
+    @app.get("/fastapi-http-error")
+    async def raise_fastapi_http_error():
+        raise HTTPException(status_code=403, detail="nope")
+
+    class Point(BaseModel):
+        x: int
+
+    @app.get("/model-error")
+    async def raise_model_error():
+        Point(x="nope")
+
+    @app.get("/integrity-error/{message}")
+    async def raise_integrity_error(message: str):
+        raise IntegrityError("INSERT INTO t", {}, Exception(message))
+
+    @app.get("/crash")
+    async def crash():
+        raise RuntimeError("kaboom")
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int):
+        return {"item_id": item_id}
+
+    return TestClient(app, raise_server_exceptions=False)
+
+
+class TestBuildErrorBody:
+    """Test the templated error body encoder."""
+
+    def test_body_matches_json_encoding(self):
+        """Test that the template produces the same JSON as a plain dict."""
+        body = _build_error_body("INVALID_PDF", 'Bad "PDF"', {"page": 3}, True)
+
+        assert orjson.loads(body) == {
+            "error_code": "INVALID_PDF",
+            "message": 'Bad "PDF"',
+            "details": {"page": 3},
+            "is_retryable": True,
+        }
+
+    def test_details_handle_non_str_keys_and_unknown_types(self):
+        """Test that details with int keys and Decimals still encode."""
+        body = _build_error_body("DB_ERROR", "x", {1: Decimal("2.5")}, False)
+
+        assert body == (
+            b'{"error_code":"DB_ERROR","message":"x",'
+            b'"details":{"1":"2.5"},"is_retryable":false}'
+        )
+
+    def test_empty_details(self):
+        """Test that empty details encode as an empty object."""
+        body = _build_error_body("INTERNAL_ERROR", "x", {}, False)
+
+        assert orjson.loads(body)["details"] == {}
+
+
+class TestErrorHandlers:
+    """Test structured error responses from the registered handlers."""
+
+    def test_app_error_response(self, client):
+        """Test that AppError is returned as a structured JSON error."""
+        response = client.get("/app-error")
+
+        assert response.status_code == 400
+        data = response.json()
+        assert data["error_code"] == "INVALID_PDF"
+        assert data["message"] == "Bad PDF"
+        assert data["details"] == {"page": 3, "7": "int key", "size": "1.5"}
+        assert data["is_retryable"] is False
+
+    @pytest.mark.parametrize(
+        "code,error_code,is_retryable",
+        [
+            (404, "RECORD_NOT_FOUND", False),
+            (429, "RATE_LIMITED", True),
+            (503, "API_ERROR", True),
+            (418, "UNKNOWN_ERROR", False),
+        ],
+    )
+    def test_http_exception_mapping(self, client, code, error_code, is_retryable):
+        """Test that HTTP status codes map to error codes and retryability."""
+        response = client.get(f"/http-error/{code}")
+
+        assert response.status_code == code
+        data = response.json()
+        assert data["error_code"] == error_code
+        assert data["is_retryable"] is is_retryable
+
+    def test_fastapi_http_exception_registered_directly(self, client):
+        """Test that fastapi.HTTPException resolves to the structured handler."""
+        assert HTTPException in client.app.exception_handlers
+
+        response = client.get("/fastapi-http-error")
+
+        assert response.status_code == 403
+        assert response.json()["error_code"] == "OPERATION_NOT_ALLOWED"
+
+    def test_request_validation_error(self, client):
+        """Test that request validation errors list the failing fields."""
+        response = client.get("/items/not-a-number")
+
+        assert response.status_code == 422
+        data = response.json()
+        assert data["error_code"] == "VALIDATION_ERROR"
+        errors = data["details"]["validation_errors"]
+        assert errors[0]["field"] == "path.item_id"
+        assert errors[0]["type"] == "int_parsing"
+
+    def test_pydantic_validation_error(self, client):
+        """Test that model validation errors use the same detail format."""
+        response = client.get("/model-error")
+
+        assert response.status_code == 422
+        data = response.json()
+        assert data["message"] == "Data validation failed"
+        assert data["details"]["validation_errors"] == [
+            {
+                "field": "x",
+                "message": "Input should be a valid integer, unable to parse "
+                "string as an integer",
+                "type": "int_parsing",
+            }
+        ]
+
+    @pytest.mark.parametrize(
+        "message,status_code,error_code",
+        [
+            ("duplicate key value violates UNIQUE constraint", 409, "DUPLICATE_RECORD"),
+            ("Key (email) ALREADY EXISTS", 409, "DUPLICATE_RECORD"),
+            ("null value in column violates not-null", 500, "DB_ERROR"),
+        ],
+    )
+    def test_integrity_error_duplicate_detection(
+        self, client, message, status_code, error_code
+    ):
+        """Test that duplicate-key errors map to 409 regardless of case."""
+        response = client.get(f"/integrity-error/{message}")
+
+        assert response.status_code == status_code
+        assert response.json()["error_code"] == error_code
+
+    def test_unhandled_exception_hides_details(self, client):
+        """Test that unexpected errors return a generic 500 outside debug."""
+        response = client.get("/crash")
+
+        assert response.status_code == 500
+        data = response.json()
+        assert data["error_code"] == "INTERNAL_ERROR"
+        assert data["details"] == {}
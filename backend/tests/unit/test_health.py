@@ -8,18 +8,37 @@ Tests cover:
 - Timestamp format validation
 """
 
+import time
 from datetime import datetime, timezone
 from unittest.mock import MagicMock, patch
 
+import pytest
 from fastapi.testclient import TestClient
 
-from src.api.routes.health import check_database, check_gemini_api
+from src.api.routes import health
+from src.api.routes.health import check_database, check_gemini_api, run_check
 from src.main import app
 
+# These tests reconfigure logging, so reset it after each one
+pytestmark = pytest.mark.usefixtures("reset_logging")
+
+
 # Create test client
 client = TestClient(app)
 
 
+@pytest.fixture(autouse=True)
+def reset_health_cache():
+    """Forget cached probe results so each test hits the mocked checks."""
+    health._db_last_ok = None
+    health._gemini_configured = None
+    health._cached_response = None
+    yield
+    health._db_last_ok = None
+    health._gemini_configured = None
+    health._cached_response = None
+
+
 # ============================================================================
 # HELPER FUNCTION TESTS
 # ============================================================================
@@ -71,11 +90,32 @@ class TestCheckDatabase:
 
         assert result == "error"
 
+    @patch("src.api.routes.health.get_engine")
+    def test_database_ok_is_cached(self, mock_get_engine):
+        """Test a recent success skips the database round trip."""
+        mock_engine = MagicMock()
+        mock_get_engine.return_value = mock_engine
+
+        assert check_database() == "ok"
+        assert check_database() == "ok"
+
+        mock_engine.connect.assert_called_once()
+
+    @patch("src.api.routes.health.get_engine")
+    def test_database_error_is_not_cached(self, mock_get_engine):
+        """Test failures are re-checked on the next probe."""
+        mock_get_engine.side_effect = Exception("Connection refused")
+
+        assert check_database() == "error"
+        assert check_database() == "error"
+
+        assert mock_get_engine.call_count == 2
+
 
 class TestCheckGeminiAPI:
     """Test Gemini API availability check."""
 
-    @patch("src.config.get_settings")
+    @patch("src.api.routes.health.get_settings")
     def test_gemini_api_ok(self, mock_get_settings):
         """Test Gemini API check returns 'ok' when API key is configured."""
         # Mock settings with valid API key
@@ -87,7 +127,7 @@ class TestCheckGeminiAPI:
 
         assert result == "ok"
 
-    @patch("src.config.get_settings")
+    @patch("src.api.routes.health.get_settings")
     def test_gemini_api_error_no_key(self, mock_get_settings):
         """Test Gemini API check returns 'error' when API key is missing."""
         # Mock settings with empty API key
@@ -99,7 +139,7 @@ class TestCheckGeminiAPI:
 
         assert result == "error"
 
-    @patch("src.config.get_settings")
+    @patch("src.api.routes.health.get_settings")
     def test_gemini_api_error_exception(self, mock_get_settings):
         """Test Gemini API check returns 'error' when exception occurs."""
         # Mock settings that raises exception
@@ -109,6 +149,39 @@ class TestCheckGeminiAPI:
 
         assert result == "error"
 
+    @patch("src.api.routes.health.get_settings")
+    def test_gemini_api_key_check_resolved_once(self, mock_get_settings):
+        """Test settings are only consulted on the first check."""
+        mock_settings = MagicMock()
+        mock_settings.gemini_api_key = "test_api_key_1234567890"
+        mock_get_settings.return_value = mock_settings
+
+        assert check_gemini_api() == "ok"
+        assert check_gemini_api() == "ok"
+
+        mock_get_settings.assert_called_once()
+
+
+class TestRunCheck:
+    """Test running blocking checks off the event loop."""
+
+    async def test_run_check_returns_status(self):
+        """Test the check result is passed through."""
+        result = await run_check("database", lambda: "ok")
+
+        assert result == "ok"
+
+    async def test_run_check_timeout_returns_error(self):
+        """Test a hung check is reported as 'error' after the timeout."""
+
+        def slow_check():
+            time.sleep(0.2)
+            return "ok"
+
+        result = await run_check("database", slow_check, timeout=0.01)
+
+        assert result == "error"
+
 
 # ============================================================================
 # ENDPOINT TESTS
@@ -140,6 +213,34 @@ class TestHealthCheckEndpoint:
         timestamp = datetime.fromisoformat(data["timestamp"].replace("Z", "+00:00"))
         assert timestamp.tzinfo is not None
 
+    @patch("src.api.routes.health.check_gemini_api")
+    @patch("src.api.routes.health.check_database")
+    def test_health_check_ok_is_cached(self, mock_check_db, mock_check_gemini):
+        """Test a healthy response is reused within the cache TTL."""
+        mock_check_db.return_value = "ok"
+        mock_check_gemini.return_value = "ok"
+
+        first = client.get("/api/health").json()
+        second = client.get("/api/health").json()
+
+        assert first == second
+        mock_check_db.assert_called_once()
+        mock_check_gemini.assert_called_once()
+
+    @patch("src.api.routes.health.check_gemini_api")
+    @patch("src.api.routes.health.check_database")
+    def test_health_check_degraded_is_not_cached(
+        self, mock_check_db, mock_check_gemini
+    ):
+        """Test degraded responses are recomputed on every request."""
+        mock_check_db.return_value = "error"
+        mock_check_gemini.return_value = "ok"
+
+        client.get("/api/health")
+        client.get("/api/health")
+
+        assert mock_check_db.call_count == 2
+
     @patch("src.api.routes.health.check_gemini_api")
     @patch("src.api.routes.health.check_database")
     def test_health_check_database_error(self, mock_check_db, mock_check_gemini):
@@ -1,14 +1,21 @@
 """Unit tests for structured logging utility."""
 
+import io
 import logging
 import os
+import queue
+import threading
+from decimal import Decimal
+from logging.handlers import QueueHandler
 from unittest.mock import patch
 
+import orjson
 import pytest
 import structlog
 
+from src.utils import logger as logger_module
 from src.utils.logger import (
-    add_module_name,
+    BufferedStreamHandler,
     add_timestamp,
     bind_context,
     clear_context,
@@ -17,6 +24,9 @@ from src.utils.logger import (
     unbind_context,
 )
 
+# These tests reconfigure logging, so reset it after each one
+pytestmark = pytest.mark.usefixtures("reset_logging")
+
 
 class TestSetupLogging:
     """Test suite for setup_logging function."""
@@ -94,6 +104,35 @@ class TestSetupLogging:
         # Just verify logger was created successfully
         assert logger is not None
 
+    def test_repeat_setup_with_same_settings_is_noop(self):
+        """Test that identical setup_logging calls only configure once."""
+        setup_logging(log_level="INFO", log_format="json")
+        logger = get_logger("repeat")
+
+        with patch("structlog.configure") as configure:
+            setup_logging(log_level="info", log_format="JSON")
+            assert get_logger("repeat") is logger
+            configure.assert_not_called()
+
+            setup_logging(log_level="DEBUG", log_format="json")
+            configure.assert_called_once()
+
+    def test_json_format_renders_with_orjson(self, caplog):
+        """Test that JSON output is a str and encodes non-JSON-native values."""
+        setup_logging(log_level="INFO", log_format="json")
+        logger = get_logger("json_test")
+
+        with caplog.at_level(logging.INFO):
+            logger.info("Rendered", cost=Decimal("0.5"), counts={1: 2})
+
+        message = caplog.records[-1].getMessage()
+        assert isinstance(message, str)
+        data = orjson.loads(message)
+        assert data["event"] == "Rendered"
+        assert data["cost"] == "Decimal('0.5')"
+        assert data["counts"] == {"1": 2}
+        assert data["level"] == "info"
+
     def test_setup_with_console_format(self):
         """Test setup_logging with console format configures correctly."""
         setup_logging(log_level="INFO", log_format="console")
@@ -145,6 +184,38 @@ class TestGetLogger:
         assert logger1 is not None
         assert logger2 is not None
 
+    def test_get_logger_caches_by_name(self):
+        """Test that the same name returns the same logger object."""
+        setup_logging()
+
+        assert get_logger("module1") is get_logger("module1")
+        assert get_logger("module1") is not get_logger("module2")
+
+    def test_get_logger_includes_module_name(self, caplog):
+        """Test that every event carries the logger name as module."""
+        setup_logging(log_level="INFO", log_format="json")
+        logger = get_logger("src.some.module")
+
+        with caplog.at_level(logging.INFO):
+            logger.info("First")
+            logger.bind(document_id=1).info("Second")
+
+        modules = [orjson.loads(r.getMessage())["module"] for r in caplog.records]
+        assert modules == ["src.some.module", "src.some.module"]
+
+    def test_setup_logging_clears_logger_cache(self, caplog):
+        """Test that reconfiguring logging is honored by cached names."""
+        setup_logging(log_level="WARNING")
+        get_logger("cached").info("hidden")
+
+        setup_logging(log_level="INFO")
+        logger = get_logger("cached")
+        with caplog.at_level(logging.INFO):
+            logger.info("shown")
+
+        assert "shown" in caplog.text
+        assert "hidden" not in caplog.text
+
     def test_logger_info_method(self, caplog):
         """Test logger.info() method."""
         setup_logging(log_level="INFO")
@@ -185,6 +256,17 @@ class TestGetLogger:
 
         assert len(caplog.records) > 0
 
+    def test_logger_filters_below_configured_level(self, caplog):
+        """Test that calls below the configured level are dropped."""
+        setup_logging(log_level="WARNING")
+        logger = get_logger("test_filtering")
+
+        with caplog.at_level(logging.DEBUG):
+            logger.debug("Debug log", field1="value1")
+            logger.info("Info log", field1="value1")
+
+        assert len(caplog.records) == 0
+
     def test_logger_critical_method(self, caplog):
         """Test logger.critical() method."""
         setup_logging(log_level="CRITICAL")
@@ -354,54 +436,131 @@ class TestStructuredFields:
 class TestProcessors:
     """Test suite for custom processors."""
 
-    def test_add_module_name_processor(self):
-        """Test add_module_name processor."""
-        # Mock logger and event_dict
+    def test_add_timestamp_processor(self):
+        """Test add_timestamp processor."""
         logger = None
         method_name = "info"
+        event_dict = {}
 
-        # Create a mock record
-        record = logging.LogRecord(
-            name="test.module",
-            level=logging.INFO,
-            pathname="",
-            lineno=0,
-            msg="test",
-            args=(),
-            exc_info=None,
-        )
+        result = add_timestamp(logger, method_name, event_dict)
 
-        event_dict = {"_record": record}
+        assert "timestamp" in result
 
-        result = add_module_name(logger, method_name, event_dict)
+    def test_add_timestamp_is_utc_iso_8601(self):
+        """Test that add_timestamp writes a UTC ISO 8601 string in place."""
+        event_dict = {}
 
-        assert result["module"] == "test.module"
+        result = add_timestamp(None, "info", event_dict)
 
-    def test_add_module_name_without_record(self):
-        """Test add_module_name processor when no record exists."""
-        logger = None
-        method_name = "info"
-        event_dict = {}
+        assert result is event_dict
+        assert result["timestamp"].endswith("Z")
+        assert "T" in result["timestamp"]
 
-        result = add_module_name(logger, method_name, event_dict)
 
-        # Should not add module if no record
-        assert "module" not in result
+class _CountingStream(io.StringIO):
+    """StringIO that counts flush calls."""
 
-    def test_add_timestamp_processor(self):
-        """Test add_timestamp processor."""
-        logger = None
-        method_name = "info"
-        event_dict = {}
+    flushes = 0
 
-        result = add_timestamp(logger, method_name, event_dict)
+    def flush(self):
+        self.flushes += 1
+        super().flush()
 
-        assert "timestamp" in result
+
+class TestBufferedStreamHandler:
+    """Test suite for the interval-flushing stream handler."""
+
+    @staticmethod
+    def _record(level=logging.INFO, msg="line"):
+        return logging.LogRecord("test", level, __file__, 1, msg, None, None)
+
+    def test_flushes_once_per_interval(self):
+        """Test that records within the interval share one flush."""
+        stream = _CountingStream()
+        handler = BufferedStreamHandler(stream, flush_interval=3600)
+
+        for _ in range(5):
+            handler.handle(self._record())
+
+        assert stream.getvalue() == "line\n" * 5
+        assert stream.flushes == 1
+
+    def test_error_records_flush_immediately(self):
+        """Test that ERROR records are flushed without waiting."""
+        stream = _CountingStream()
+        handler = BufferedStreamHandler(stream, flush_interval=3600)
+
+        handler.handle(self._record())
+        handler.handle(self._record(level=logging.ERROR))
+
+        assert stream.flushes == 2
+
+    def test_setup_logging_writes_through_background_listener(self):
+        """Test that records are queued and written by the listener thread."""
+        root = logging.getLogger()
+        level = root.level
+        stream = io.StringIO()
+        with patch.object(root, "handlers", []), patch("sys.stdout", stream):
+            setup_logging(log_level="INFO", log_format="json")
+            try:
+                (handler,) = root.handlers
+                assert isinstance(handler, QueueHandler)
+                assert isinstance(
+                    logger_module._log_listener.handlers[0], BufferedStreamHandler
+                )
+
+                get_logger("queued").info("Through the queue")
+            finally:
+                logger_module._stop_log_listener()
+                root.setLevel(level)
+
+        assert logger_module._log_listener is None
+        assert orjson.loads(stream.getvalue())["event"] == "Through the queue"
+
+    def test_listener_flushes_only_when_queue_is_idle(self):
+        """Test that buffered lines are flushed once the queue runs dry."""
+        stream = _CountingStream()
+        log_queue = queue.SimpleQueue()
+        listener = logger_module._FlushingQueueListener(
+            log_queue, BufferedStreamHandler(stream, flush_interval=3600)
+        )
+        listener.handlers[0].handle(self._record())
+        assert stream.flushes == 1
+
+        # Records waiting: keep batching
+        record = self._record()
+        log_queue.put(record)
+        assert listener.dequeue(True) is record
+        assert stream.flushes == 1
+
+        # Queue empty: flush before blocking for the next record
+        threading.Timer(0.05, log_queue.put, args=(record,)).start()
+        assert listener.dequeue(True) is record
+        assert stream.flushes == 2
 
 
 class TestLogLevelFiltering:
     """Test suite for log level filtering."""
 
+    def test_stdlib_logger_level_filters_before_processors(self, caplog):
+        """Test that a raised stdlib logger level drops events first."""
+        setup_logging(log_level="INFO")
+        processors = structlog.get_config()["processors"]
+        assert processors[0] is structlog.stdlib.filter_by_level
+
+        logging.getLogger("noisy").setLevel(logging.WARNING)
+        try:
+            logger = get_logger("noisy")
+            with caplog.at_level(logging.INFO):
+                logger.info("Dropped")
+                logger.warning("Kept")
+        finally:
+            logging.getLogger("noisy").setLevel(logging.NOTSET)
+
+        messages = [record.getMessage() for record in caplog.records]
+        assert not any("Dropped" in message for message in messages)
+        assert any("Kept" in message for message in messages)
+
     def test_debug_logs_not_shown_at_info_level(self, caplog):
         """Test that DEBUG logs are filtered when level is INFO."""
         setup_logging(log_level="INFO")
@@ -11,7 +11,10 @@ Note: Environment variables are set in conftest.py before importing the app.
 
 import pytest
 from fastapi.testclient import TestClient
-from unittest.mock import patch
+from unittest.mock import MagicMock, call, patch
+
+# These tests reconfigure logging, so reset it after each one
+pytestmark = pytest.mark.usefixtures("reset_logging")
 
 
 @pytest.fixture
@@ -23,7 +26,10 @@ def client():
     Returns:
         TestClient instance for testing FastAPI endpoints
     """
-    with patch("src.main.init_db"):
+    with (
+        patch("src.main.init_db"),
+        patch("src.utils.api_log_writer.ensure_api_log_partitions"),
+    ):
         from src.main import app
 
         with TestClient(app) as test_client:
@@ -42,6 +48,21 @@ class TestApplicationInitialization:
         assert app.version == "1.0.0"
         assert "document processing" in app.description.lower()
 
+    def test_app_state_settings(self, client):
+        """Test that settings are stored on app.state for request handlers."""
+        from src.config import Settings
+        from src.main import app
+
+        assert isinstance(app.state.settings, Settings)
+
+    def test_app_default_response_class(self, client):
+        """Test that routes encode JSON with orjson by default."""
+        from fastapi.responses import ORJSONResponse
+
+        from src.main import app
+
+        assert app.router.default_response_class is ORJSONResponse
+
     def test_app_debug_docs(self, client):
         """Test that docs are enabled in debug mode."""
         from src.main import app
@@ -51,6 +72,19 @@ class TestApplicationInitialization:
         assert app.redoc_url == "/redoc"
         assert app.openapi_url == "/openapi.json"
 
+    def test_openapi_schema_encoded_once(self, client):
+        """Test that /openapi.json is served from cached bytes."""
+        from src.main import app
+
+        with patch.object(app, "openapi", wraps=app.openapi) as openapi:
+            first = client.get("/openapi.json")
+            second = client.get("/openapi.json")
+
+        assert first.status_code == 200
+        assert first.content == second.content
+        assert "/api/health" in first.json()["paths"]
+        assert openapi.call_count <= 1
+
 
 class TestHealthCheckEndpoint:
     """Test suite for health check endpoints."""
@@ -116,6 +150,38 @@ class TestRootEndpoint:
         # In debug mode, docs_url should be present
         assert data["docs_url"] == "/docs"
 
+    def test_static_payloads_follow_debug_flag(self):
+        """Test that pre-rendered payloads hide docs_url outside debug mode."""
+        import orjson
+        from fastapi import FastAPI
+
+        from src.main import build_static_payloads
+
+        settings = MagicMock(app_name="App", env="production", debug=False)
+        payloads = build_static_payloads(FastAPI(docs_url=None), settings)
+
+        assert orjson.loads(payloads["root"])["docs_url"] is None
+        assert orjson.loads(payloads["health"])["environment"] == "production"
+
+
+class TestPrewarm:
+    """Test suite for background module prewarming."""
+
+    async def test_prewarm_imports_module(self):
+        """Test that prewarm imports each of the given modules."""
+        from src.main import prewarm_imports
+
+        with patch("src.main.importlib.import_module") as import_module:
+            await prewarm_imports(("PyPDF2", "google.genai"))
+
+        assert import_module.call_args_list == [call("PyPDF2"), call("google.genai")]
+
+    async def test_prewarm_ignores_missing_module(self):
+        """Test that a missing module does not raise."""
+        from src.main import prewarm_imports
+
+        await prewarm_imports(("nonexistent_module_for_prewarm_test",))
+
 
 class TestMiddleware:
     """Test suite for middleware configuration."""
@@ -128,6 +194,72 @@ class TestMiddleware:
         # TestClient may not expose CORS headers in the same way as real HTTP requests
         assert len(app.user_middleware) > 0, "Middleware should be registered"
 
+    def test_cors_allows_configured_origin(self, client):
+        """Test that preflight requests from a configured origin succeed."""
+        from src.main import app
+
+        origin = app.state.settings.cors_origins[0]
+        response = client.options(
+            "/health",
+            headers={"Origin": origin, "Access-Control-Request-Method": "GET"},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["access-control-allow-origin"] == origin
+
+    def test_cors_rejects_unknown_origin(self, client):
+        """Test that preflight requests from other origins are rejected."""
+        response = client.options(
+            "/health",
+            headers={
+                "Origin": "https://evil.example.com",
+                "Access-Control-Request-Method": "GET",
+            },
+        )
+
+        assert response.status_code == 400
+
+    def test_cors_config_summary_cached_per_settings(self, client):
+        """Test that the CORS summary is built once per settings instance."""
+        from src.main import app
+        from src.middleware.cors_middleware import get_cors_config_summary
+
+        settings = app.state.settings
+        summary = get_cors_config_summary(settings)
+
+        assert get_cors_config_summary(settings) is summary
+        assert summary["allowed_origins"] == settings.cors_origins
+
+        other = settings.model_copy(update={"cors_origins": ("https://x.example",)})
+        assert get_cors_config_summary(other)["allowed_origins"] == (
+            "https://x.example",
+        )
+
+    def test_request_id_generated(self, client):
+        """Test that responses carry a generated X-Request-ID."""
+        response = client.get("/health")
+
+        assert len(response.headers["x-request-id"]) == 32
+
+    def test_request_id_echoed(self, client):
+        """Test that a client-supplied X-Request-ID is echoed back."""
+        response = client.get("/health", headers={"X-Request-ID": "abc-123"})
+
+        assert response.headers["x-request-id"] == "abc-123"
+
+    def test_oversized_request_id_replaced(self, client):
+        """Test that overly long client request IDs are not echoed."""
+        response = client.get("/health", headers={"X-Request-ID": "x" * 200})
+
+        assert response.headers["x-request-id"] != "x" * 200
+
+    def test_request_id_on_error_responses(self, client):
+        """Test that handled error responses also carry the request ID."""
+        response = client.get("/nonexistent", headers={"X-Request-ID": "err-1"})
+
+        assert response.status_code == 404
+        assert response.headers["x-request-id"] == "err-1"
+
     def test_error_handling_middleware(self, client):
         """Test that error handling middleware catches exceptions."""
         # Request a non-existent endpoint
@@ -8,8 +8,11 @@ Tests cover:
 - Model registration with Base
 """
 
+from unittest.mock import MagicMock, patch
+
 import pytest
-from sqlalchemy import text
+from sqlalchemy import select, text
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.orm import Session
 
 from src.models import (
@@ -41,6 +44,18 @@ class TestEngineFactory:
         engine2 = get_engine()
         assert engine1 is engine2
 
+    def test_get_engine_sets_pool_and_application_name(self, monkeypatch):
+        """Test that the engine is configured from settings."""
+        import src.models as models
+
+        monkeypatch.setattr(models, "_engine", None)
+        with patch.object(models, "create_engine") as create_engine:
+            get_engine()
+
+        kwargs = create_engine.call_args.kwargs
+        assert kwargs["pool_recycle"] == 1800
+        assert kwargs["connect_args"] == {"application_name": "ebook_summary"}
+
     def test_engine_can_connect(self):
         """Test that the engine can establish a database connection."""
         engine = get_engine()
@@ -59,6 +74,12 @@ class TestSessionFactory:
 
         assert SessionLocal.kw.get("bind") is not None
 
+    def test_session_factory_keeps_objects_after_commit(self):
+        """Test that committed objects are not expired (no refresh SELECT)."""
+        from src.models import SessionLocal
+
+        assert SessionLocal.kw.get("expire_on_commit") is False
+
     def test_session_can_be_created(self):
         """Test that SessionLocal can create database sessions."""
         init_db()
@@ -193,7 +214,14 @@ class TestModelRegistration:
         # After models are imported, Base.metadata should have table definitions
         table_names = list(Base.metadata.tables.keys())
 
-        expected_tables = ["users", "documents", "summaries", "mindmaps", "api_logs"]
+        expected_tables = [
+            "users",
+            "documents",
+            "document_texts",
+            "summaries",
+            "mindmaps",
+            "api_logs",
+        ]
 
         for table_name in expected_tables:
             assert table_name in table_names, (
@@ -217,9 +245,11 @@ class TestModuleExports:
             "get_db_context",
             "User",
             "Document",
+            "DocumentText",
             "Summary",
             "Mindmap",
             "APILog",
+            "GenerationStatus",
         ]
 
         assert set(__all__) == set(expected_exports)
@@ -294,7 +324,7 @@ class TestEdgeCases:
         engine = get_engine()
 
         # Engine should still be valid even if we have a failed connection attempt
-        # (This is handled by pool_pre_ping=True)
+        # (Stale connections are invalidated on disconnect and recycled)
         try:
             with engine.connect() as conn:
                 result = conn.execute(text("SELECT 1")).scalar()
@@ -332,3 +362,77 @@ class TestDocumentation:
         """Test that init_db has comprehensive docstring."""
         assert init_db.__doc__ is not None
         assert "initialize" in init_db.__doc__.lower()
+
+
+class TestRelationshipLoading:
+    """Test relationship loader strategies that avoid N+1 queries."""
+
+    def test_summary_document_is_joined(self):
+        """Test that Summary.document is loaded with an inner join."""
+        relationship = Summary.__mapper__.relationships["document"]
+
+        assert relationship.lazy == "joined"
+        assert relationship.innerjoin is True
+
+    def test_user_documents_is_lazy(self):
+        """Test that User.documents is only loaded when a query asks for it."""
+        assert User.__mapper__.relationships["documents"].lazy == "select"
+
+
+class TestSummaryErrorMessage:
+    """Test Summary.error_message truncation."""
+
+    def test_long_error_message_is_truncated(self):
+        """Test that long messages are capped at the column length."""
+        summary = Summary(error_message="x" * 5000)
+
+        assert len(summary.error_message) == 2000
+
+    def test_short_error_message_is_kept(self):
+        """Test that short messages and None are stored unchanged."""
+        assert Summary(error_message="boom").error_message == "boom"
+        assert Summary(error_message=None).error_message is None
+
+
+class TestSummaryBulkInsert:
+    """Test Summary.bulk_insert."""
+
+    def test_bulk_insert_uses_one_executemany(self):
+        """Test that all rows are sent in one idempotent INSERT."""
+        session = MagicMock()
+        rows = [
+            {"document_id": 1, "summary_text": "a"},
+            {"document_id": 2, "summary_text": "b"},
+        ]
+
+        Summary.bulk_insert(session, rows)
+
+        session.execute.assert_called_once()
+        statement, params = session.execute.call_args.args
+        assert params is rows
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT (document_id) DO NOTHING" in sql
+
+    def test_bulk_insert_skips_empty_rows(self):
+        """Test that no statement is executed for an empty batch."""
+        session = MagicMock()
+
+        Summary.bulk_insert(session, [])
+
+        session.execute.assert_not_called()
+
+
+class TestMindmapTitle:
+    """Test the Mindmap.title hybrid property."""
+
+    def test_title_instance_reads_loaded_json(self):
+        """Test that the instance side reads the root title."""
+        assert Mindmap(mindmap_json={"title": "Root", "children": []}).title == "Root"
+        assert Mindmap().title is None
+
+    def test_title_query_uses_jsonb_path(self):
+        """Test that selecting the title only extracts it in PostgreSQL."""
+        sql = str(select(Mindmap.title).compile(dialect=postgresql.dialect()))
+
+        assert "mindmaps.mindmap_json ->> " in sql
+        assert "mindmaps.mindmap_json," not in sql
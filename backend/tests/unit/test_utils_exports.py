@@ -0,0 +1,37 @@
+"""Unit tests for the lazy re-exports in src.utils."""
+
+import subprocess
+import sys
+
+import pytest
+
+import src.utils as utils
+from src.utils import error_handler, validators
+
+
+class TestLazyExports:
+    """Test PEP 562 re-exports of the utils package."""
+
+    def test_exports_resolve_to_submodule_objects(self):
+        """Test that every exported name resolves to its defining object."""
+        assert utils.validate_filename is validators.validate_filename
+        assert utils.AppError is error_handler.AppError
+        for name in utils.__all__:
+            assert getattr(utils, name) is not None
+
+    def test_unknown_attribute_raises(self):
+        """Test that names outside __all__ still raise AttributeError."""
+        with pytest.raises(AttributeError):
+            utils.not_exported
+
+    def test_importing_one_submodule_skips_the_others(self):
+        """Test that importing the logger does not import the validators."""
+        code = (
+            "import sys, src.utils.logger; "
+            "print('src.utils.validators' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == "False"
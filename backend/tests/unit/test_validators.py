@@ -9,6 +9,7 @@ Tests cover:
 """
 
 import io
+import pickle
 from typing import BinaryIO
 
 import pytest
@@ -174,6 +175,8 @@ class TestValidateFilename:
             "image.jpg",
             "file.docx",
             "noextension",
+            "file.pdf.exe",
+            "pdf",
         ]
 
         for filename in invalid_filenames:
@@ -240,6 +243,35 @@ class TestValidatePdfFormat:
         # Verify file pointer is reset
         assert pdf_file.tell() == 0
 
+    @pytest.mark.parametrize("wrap", [bytearray, memoryview])
+    def test_bytes_like_buffers(self, wrap):
+        """Test that bytearray and memoryview inputs are checked in place."""
+        validate_pdf_format(wrap(PDF_MAGIC_BYTES + b"1.4\n"))
+
+        with pytest.raises(ValidationError) as exc_info:
+            validate_pdf_format(wrap(b"PK\x03\x04 not a pdf"))
+        assert "signature" in exc_info.value.message.lower()
+
+        with pytest.raises(ValidationError) as exc_info:
+            validate_pdf_format(wrap(b""))
+        assert "empty" in exc_info.value.message.lower()
+
+    def test_reads_only_signature_bytes(self):
+        """Test that only the magic bytes are read from a file-like object."""
+        pdf_file = io.BytesIO(PDF_MAGIC_BYTES + b"1.4\n" + b"x" * 4096)
+        reads = []
+        original_read = pdf_file.read
+
+        def tracking_read(size=-1):
+            reads.append(size)
+            return original_read(size)
+
+        pdf_file.read = tracking_read
+        validate_pdf_format(pdf_file)
+
+        assert reads == [len(PDF_MAGIC_BYTES)]
+        assert pdf_file.tell() == 0
+
     def test_empty_content(self):
         """Test that empty content raises error."""
         with pytest.raises(ValidationError) as exc_info:
@@ -375,3 +407,12 @@ class TestValidationErrorClass:
         """Test that ValidationError is an Exception."""
         error = ValidationError("TEST_ERROR", "Test message")
         assert isinstance(error, Exception)
+
+    def test_validation_error_uses_slots_and_pickles(self):
+        """Test that attributes live in slots and the error round-trips."""
+        error = ValidationError("TEST_ERROR", "Test message")
+
+        assert "error_code" not in vars(error)
+        restored = pickle.loads(pickle.dumps(error))
+        assert restored.error_code == "TEST_ERROR"
+        assert str(restored) == "TEST_ERROR: Test message"